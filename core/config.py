@@ -21,6 +21,8 @@ class Config:
         self._data = {}
         # _user_config_path: str - path to the user's config file
         self._user_config_path = self._get_user_config_path()
+        # _dirty: bool - True when values changed since the last load/save
+        self._dirty = False
         self._load()
 
     def _get_user_config_path(self):
@@ -64,9 +66,13 @@ class Config:
     def save(self):
         """
         Persists current configuration to the user config file.
+        Does nothing if no value changed since the last save.
         """
+        if not self._dirty:
+            return
         with open(self._user_config_path, "w") as f:
             json.dump(self._data, f, indent=4)
+        self._dirty = False
 
     def get(self, *keys, default=None):
         """
@@ -103,7 +109,9 @@ class Config:
             if key not in node or not isinstance(node[key], dict):
                 node[key] = {}
             node = node[key]
-        node[keys[-1]] = value
+        if node.get(keys[-1], self) != value:
+            node[keys[-1]] = value
+            self._dirty = True
 
     def get_all(self):
         """
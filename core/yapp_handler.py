@@ -105,7 +105,7 @@ class YappHandler:
         self._download_dir = ""
         self._timer = None
         self._si_retries = 0
-        self._lock = threading.Lock()
+        self._lock = threading.RLock()
 
     # ========================================================================
     # Public API
@@ -172,7 +172,7 @@ class YappHandler:
     def process_data(self, data):
         """
         Procesa bytes crudos recibidos del puerto serie.
-        Debe ser llamado desde el polling loop de la GUI.
+        Se llama desde el hilo lector del puerto serie (data sink) o la GUI.
 
         Args:
             data: bytes - datos recibidos del serial
@@ -210,6 +210,10 @@ class SettingsDialog(tk.Toplevel):
         )
         self._init_text.pack(fill=tk.BOTH, expand=True)
         self._init_text.insert("1.0", current_init)
+        # Python-side mirror of the init text, refreshed on <<Modified>>
+        self._init_text_cache = current_init
+        self._init_text.edit_modified(False)
+        self._init_text.bind("<<Modified>>", self._on_init_modified)
 
         # Bind model combobox change to update modes and init commands
         model_var = self._vars.get("tnc.model")
@@ -218,6 +222,13 @@ class SettingsDialog(tk.Toplevel):
 
         return frame
 
+    def _on_init_modified(self, event=None):
+        """Refreshes the cached init commands text after an edit."""
+        if not self._init_text.edit_modified():
+            return
+        self._init_text_cache = self._init_text.get("1.0", "end-1c")
+        self._init_text.edit_modified(False)
+
     def _on_tnc_model_changed(self, *args):
         """Called when TNC model combobox changes. Updates modes display and init commands."""
         model = self._vars.get("tnc.model", tk.StringVar()).get()
@@ -228,7 +239,7 @@ class SettingsDialog(tk.Toplevel):
 
         # Update init commands (only if user hasn't modified them from the previous default)
         # Get previous model's default init
-        current_init_text = self._init_text.get("1.0", "end-1c").strip()
+        current_init_text = self._init_text_cache.strip()
         # Check if current text matches any model's default
         is_default = False
         for m_info in TNC_MODELS.values():
@@ -238,6 +249,7 @@ class SettingsDialog(tk.Toplevel):
         if is_default or not current_init_text:
             self._init_text.delete("1.0", tk.END)
             self._init_text.insert("1.0", info["init"])
+            self._init_text_cache = info["init"]
 
     def _build_serial_tab(self, parent):
         """Builds the Serial Port settings tab. Returns: tk.Frame"""
@@ -439,7 +451,7 @@ class SettingsDialog(tk.Toplevel):
 
     def _refresh_ports(self):
         """Refreshes serial port list."""
-        ports = SerialHandler.list_ports()
+        ports = SerialHandler.list_ports(force=True)
         if not ports:
             ports = ["(no ports found)"]
         # Update all comboboxes in widget tree
@@ -465,8 +477,7 @@ class SettingsDialog(tk.Toplevel):
         # TNC
         self._config.set("tnc", "model",
                          self._vars.get("tnc.model", tk.StringVar()).get())
-        self._config.set("tnc", "init_commands",
-                         self._init_text.get("1.0", "end-1c"))
+        self._config.set("tnc", "init_commands", self._init_text_cache)
         self._config.set("tnc", "autocomplete", self._ac_var.get())
 
         # Serial
@@ -3,10 +3,25 @@ YAPP File Transfer Dialog - shows progress, control messages, and transfer statu
 """
 import tkinter as tk
 import tkinter.ttk as ttk
+import collections
+import functools
 import time
 from gui import theme
 from core.yapp_handler import YappEvent
 
+# YappEvent -> (message tag, prefix, arrow tag)
+_EVENT_DISPATCH = {
+    YappEvent.SENT: ("sent", "▲ TX  ", "arrow_tx"),
+    YappEvent.RECEIVED: ("received", "▼ RX  ", "arrow_rx"),
+    YappEvent.INFO: ("info", "  ℹ   ", "info"),
+    YappEvent.ERROR: ("error", "  ✖   ", "error"),
+    YappEvent.SUCCESS: ("success", "  ✔   ", "success"),
+}
+_DEFAULT_DISPATCH = ("info", "      ", "info")
+
+_KB = 1024
+_MB = _KB * _KB
+
 
 class YappTransferDialog(tk.Toplevel):
     """
@@ -25,8 +40,27 @@ class YappTransferDialog(tk.Toplevel):
         super().__init__(parent)
         self._mode = mode
         self._on_cancel = on_cancel
-        self._start_time = time.time()
+        self._speed_ema = None          # bytes/s, exponential moving average (None = no sample yet)
+        self._last_speed_t = time.monotonic()
+        self._last_speed_bytes = 0
         self._closed = False
+        self._finalized = False         # transfer_finished applied; ignore late progress
+        self._pending_progress = None   # latest (transferred, total) not yet drawn
+        self._flush_scheduled = False
+        self._last_draw_ts = 0.0        # time.monotonic() of the last canvas redraw
+        self._min_frame_dt = 1 / 30     # at most ~30 redraws per second
+        self._redraw_job = None         # deferred redraw of a throttled update
+        self._log_queue = collections.deque()   # pending log entries
+        self._log_flush_scheduled = False
+        self._log_max_lines = 500
+        self._ts_sec = 0                # second for which _ts_str was formatted
+        self._ts_str = ""
+        self._colors = self._snapshot_colors()
+
+        # Text variables for the fast-moving stats labels
+        self._var_pct = tk.StringVar(self, value="0%")
+        self._var_transferred = tk.StringVar(self, value="0 bytes")
+        self._var_speed = tk.StringVar(self, value="")
 
         title = "YAPP Send" if mode == "send" else "YAPP Receive"
         self.title(f"📡  {title}")
@@ -41,6 +75,24 @@ class YappTransferDialog(tk.Toplevel):
         self._center()
         self.grab_set()
 
+    @staticmethod
+    def _snapshot_colors():
+        """
+        Lee una sola vez los colores del tema usados al dibujar el progreso.
+
+        Returns:
+            dict - clave del tema -> color hex
+        """
+        return {key: theme.get(key) for key in
+                ("bg_dark", "accent_primary", "accent_secondary", "text_primary")}
+
+    def invalidate_theme_cache(self):
+        """Recarga los colores cacheados tras un cambio de tema y redibuja."""
+        self._colors = self._snapshot_colors()
+        if not self._closed and self.winfo_exists():
+            self._apply_progress_colors()
+            self._draw_progress_bar(self._progress_pct, force=True)
+
     def _center(self):
         self.update_idletasks()
         x = (self.winfo_screenwidth() - self.winfo_width()) // 2
@@ -54,11 +106,11 @@ class YappTransferDialog(tk.Toplevel):
         accent = theme.get("accent_primary")
         dim = theme.get("text_dim")
 
-        main = tk.Frame(self, bg=bg)
+        main = ttk.Frame(self, style="Dialog.TFrame")
         main.pack(fill=tk.BOTH, expand=True, padx=12, pady=10)
 
         # -- Header --
-        hdr = tk.Frame(main, bg=bg)
+        hdr = ttk.Frame(main, style="Dialog.TFrame")
         hdr.pack(fill=tk.X, pady=(0, 8))
 
         icon = "📤" if self._mode == "send" else "📥"
@@ -73,7 +125,7 @@ class YappTransferDialog(tk.Toplevel):
         info_frame.pack(fill=tk.X, pady=(0, 8))
 
         # Filename
-        fn_frame = tk.Frame(info_frame, bg=theme.get("bg_light"))
+        fn_frame = ttk.Frame(info_frame, style="Light.TFrame")
         fn_frame.pack(fill=tk.X)
         tk.Label(fn_frame, text="File:", font=("Segoe UI", 9),
                  bg=theme.get("bg_light"), fg=dim, width=8, anchor="w").pack(side=tk.LEFT)
@@ -83,7 +135,7 @@ class YappTransferDialog(tk.Toplevel):
         self._lbl_filename.pack(side=tk.LEFT, fill=tk.X, expand=True)
 
         # Size
-        sz_frame = tk.Frame(info_frame, bg=theme.get("bg_light"))
+        sz_frame = ttk.Frame(info_frame, style="Light.TFrame")
         sz_frame.pack(fill=tk.X)
         tk.Label(sz_frame, text="Size:", font=("Segoe UI", 9),
                  bg=theme.get("bg_light"), fg=dim, width=8, anchor="w").pack(side=tk.LEFT)
@@ -92,7 +144,7 @@ class YappTransferDialog(tk.Toplevel):
         self._lbl_size.pack(side=tk.LEFT, fill=tk.X, expand=True)
 
         # -- Progress bar --
-        prog_frame = tk.Frame(main, bg=bg)
+        prog_frame = ttk.Frame(main, style="Dialog.TFrame")
         prog_frame.pack(fill=tk.X, pady=(0, 4))
 
         # Custom canvas progress bar for better theming
@@ -102,32 +154,45 @@ class YappTransferDialog(tk.Toplevel):
         self._progress_canvas.pack(fill=tk.X)
         self._progress_pct = 0.0
 
-        # Stats line
-        stats_frame = tk.Frame(main, bg=bg)
-        stats_frame.pack(fill=tk.X, pady=(0, 8))
-
-        self._lbl_transferred = tk.Label(stats_frame, text="0 bytes",
+        # Persistent canvas items: redraws only move/reconfigure them
+        c = self._progress_canvas
+        self._pb_bg = c.create_rectangle(0, 0, 0, 0, outline="")
+        self._pb_fill = c.create_rectangle(0, 0, 0, 0, outline="", state="hidden")
+        self._pb_highlight = c.create_rectangle(0, 0, 0, 0, outline="", state="hidden")
+        self._pb_text = c.create_text(0, 0, text="", font=("Consolas", 9, "bold"))
+        self._apply_progress_colors()
+        self._resize_job = None
+        self._last_fill_w = -1          # fill width and text of the last redraw
+        self._last_pct_s = ""
+        c.bind("<Configure>", self._on_resize)
+
+        # Stats line (packed on first progress update, see _show_stats)
+        self._prog_frame = prog_frame
+        self._stats_frame = stats_frame = ttk.Frame(main, style="Dialog.TFrame")
+
+        self._lbl_transferred = tk.Label(stats_frame, textvariable=self._var_transferred,
                                           font=("Consolas", 9), bg=bg,
                                           fg=theme.get("accent_secondary"), anchor="w")
         self._lbl_transferred.pack(side=tk.LEFT)
 
-        self._lbl_speed = tk.Label(stats_frame, text="", font=("Consolas", 9),
+        self._lbl_speed = tk.Label(stats_frame, textvariable=self._var_speed,
+                                    font=("Consolas", 9),
                                     bg=bg, fg=dim, anchor="e")
         self._lbl_speed.pack(side=tk.RIGHT)
 
-        self._lbl_pct = tk.Label(stats_frame, text="0%", font=("Consolas", 9, "bold"),
+        self._lbl_pct = tk.Label(stats_frame, textvariable=self._var_pct,
+                                  font=("Consolas", 9, "bold"),
                                   bg=bg, fg=accent)
         self._lbl_pct.pack(side=tk.RIGHT, padx=(0, 12))
 
-        # -- Control messages log --
-        log_label = tk.Label(main, text="Protocol Messages", font=("Segoe UI", 9, "bold"),
-                             bg=bg, fg=theme.get("accent_cyan"), anchor="w")
-        log_label.pack(fill=tk.X, pady=(0, 2))
+        # -- Control messages log (packed on first log event, see _show_log) --
+        self._log_label = tk.Label(main, text="Protocol Messages",
+                                   font=("Segoe UI", 9, "bold"),
+                                   bg=bg, fg=theme.get("accent_cyan"), anchor="w")
 
-        log_frame = tk.Frame(main, bg=theme.get("bg_dark"),
-                             highlightbackground=theme.get("border_accent"),
-                             highlightthickness=1)
-        log_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 8))
+        self._log_frame = log_frame = tk.Frame(main, bg=theme.get("bg_dark"),
+                                               highlightbackground=theme.get("border_accent"),
+                                               highlightthickness=1)
 
         self._log_text = tk.Text(
             log_frame, wrap=tk.WORD, font=("Consolas", 9),
@@ -135,8 +200,12 @@ class YappTransferDialog(tk.Toplevel):
             insertbackground=theme.get("bg_dark"),
             selectbackground=theme.get("bg_highlight"),
             selectforeground=fg,
-            borderwidth=0, padx=6, pady=4, state=tk.DISABLED, cursor="arrow"
+            borderwidth=0, padx=6, pady=4, cursor="arrow"
         )
+        # Read-only without toggling state on every insert: swallow edits instead
+        self._log_text.bind("<Key>", self._on_log_key)
+        for seq in ("<<Paste>>", "<<Cut>>", "<<Clear>>", "<Button-2>"):
+            self._log_text.bind(seq, lambda e: "break")
         scrollbar = tk.Scrollbar(log_frame, command=self._log_text.yview,
                                   bg=theme.get("scrollbar_bg"),
                                   troughcolor=theme.get("bg_dark"),
@@ -144,27 +213,12 @@ class YappTransferDialog(tk.Toplevel):
         self._log_text.configure(yscrollcommand=scrollbar.set)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         self._log_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-
-        # Configure tags for coloring
-        self._log_text.tag_configure("time", foreground=theme.get("text_dim"),
-                                      font=("Consolas", 8))
-        self._log_text.tag_configure("sent", foreground=theme.get("accent_secondary"),
-                                      font=("Consolas", 9, "bold"))
-        self._log_text.tag_configure("received", foreground=theme.get("accent_primary"),
-                                      font=("Consolas", 9, "bold"))
-        self._log_text.tag_configure("info", foreground=theme.get("text_secondary"),
-                                      font=("Consolas", 9))
-        self._log_text.tag_configure("error", foreground=theme.get("accent_error"),
-                                      font=("Consolas", 9, "bold"))
-        self._log_text.tag_configure("success", foreground=theme.get("accent_secondary"),
-                                      font=("Consolas", 9, "bold"))
-        self._log_text.tag_configure("arrow_tx", foreground=theme.get("accent_secondary"),
-                                      font=("Consolas", 9))
-        self._log_text.tag_configure("arrow_rx", foreground=theme.get("accent_primary"),
-                                      font=("Consolas", 9))
+        self._stats_shown = False
+        self._log_shown = False
+        self._tags_done = False
 
         # -- Buttons --
-        btn_frame = tk.Frame(main, bg=bg)
+        self._btn_frame = btn_frame = ttk.Frame(main, style="Dialog.TFrame")
         btn_frame.pack(fill=tk.X)
 
         self._btn_cancel = tk.Button(
@@ -208,13 +262,29 @@ class YappTransferDialog(tk.Toplevel):
     def update_progress(self, transferred, total):
         """
         Actualiza barra de progreso y contadores.
+        Las llamadas rápidas se agrupan: solo se dibuja el último valor
+        en el siguiente ciclo idle.
 
         Args:
             transferred: int - bytes transferidos
             total: int - bytes totales
         """
-        if self._closed:
+        if self._closed or self._finalized:
             return
+        self._pending_progress = (transferred, total)
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.after_idle(self._flush_progress)
+
+    def _flush_progress(self):
+        """Aplica el último progreso pendiente a la barra y las etiquetas."""
+        pending = self._pending_progress
+        self._pending_progress = None
+        if self._closed or self._finalized or pending is None:
+            self._flush_scheduled = False
+            return
+        transferred, total = pending
+        self._show_stats()
 
         # Percentage
         if total > 0:
@@ -223,19 +293,34 @@ class YappTransferDialog(tk.Toplevel):
             pct = 0.0
         self._progress_pct = pct
 
-        # Draw progress bar
-        self._draw_progress_bar(pct)
+        # Draw progress bar (throttled, except at the 0%/100% boundaries)
+        now = time.monotonic()
+        wait = self._min_frame_dt - (now - self._last_draw_ts)
+        if wait <= 0 or pct in (0.0, 100.0):
+            self._draw_progress_bar(pct)
+            self._last_draw_ts = now
+        elif self._redraw_job is None:
+            # Make sure the last throttled value still reaches the canvas
+            self._redraw_job = self.after(max(1, int(wait * 1000)),
+                                          self._draw_deferred)
 
         # Labels
-        self._lbl_pct.configure(text=f"{pct:.1f}%")
-        self._lbl_transferred.configure(
-            text=f"{self._format_size(transferred)} / {self._format_size(total)}")
-
-        # Speed
-        elapsed = time.time() - self._start_time
-        if elapsed > 0.5 and transferred > 0:
-            speed = transferred / elapsed
-            self._lbl_speed.configure(text=f"{self._format_size(int(speed))}/s")
+        self._var_pct.set(f"{pct:.1f}%")
+        self._var_transferred.set(
+            f"{self._format_size(transferred)} / {self._format_size(total)}")
+
+        # Speed (EMA of the throughput over the last interval)
+        dt = now - self._last_speed_t
+        if dt >= 0.5:
+            inst = (transferred - self._last_speed_bytes) / dt
+            # Seed with the first sample so early readings are not biased toward 0
+            self._speed_ema = (inst if self._speed_ema is None
+                               else 0.7 * self._speed_ema + 0.3 * inst)
+            self._var_speed.set(f"{self._format_size(int(self._speed_ema))}/s")
+            self._last_speed_t = now
+            self._last_speed_bytes = transferred
+
+        self._flush_scheduled = False
 
     def log_event(self, event_type, message):
         """
@@ -247,30 +332,47 @@ class YappTransferDialog(tk.Toplevel):
         """
         if self._closed:
             return
+        self._ensure_tags_configured()
+        self._show_log()
 
-        self._log_text.configure(state=tk.NORMAL)
-
-        # Timestamp
-        ts = time.strftime("%H:%M:%S")
-        self._log_text.insert(tk.END, f"[{ts}] ", "time")
+        # Timestamp (formatted at most once per second)
+        now_s = int(time.time())
+        if now_s != self._ts_sec:
+            self._ts_sec = now_s
+            self._ts_str = time.strftime("%H:%M:%S", time.localtime(now_s))
+        ts = self._ts_str
 
         # Direction arrow and tag
-        tag_map = {
-            YappEvent.SENT: ("sent", "▲ TX  "),
-            YappEvent.RECEIVED: ("received", "▼ RX  "),
-            YappEvent.INFO: ("info", "  ℹ   "),
-            YappEvent.ERROR: ("error", "  ✖   "),
-            YappEvent.SUCCESS: ("success", "  ✔   "),
-        }
-        tag, prefix = tag_map.get(event_type, ("info", "      "))
-        arrow_tag = "arrow_tx" if event_type == YappEvent.SENT else (
-            "arrow_rx" if event_type == YappEvent.RECEIVED else tag)
-
-        self._log_text.insert(tk.END, prefix, arrow_tag)
-        self._log_text.insert(tk.END, message + "\n", tag)
-
-        self._log_text.configure(state=tk.DISABLED)
-        self._log_text.see(tk.END)
+        tag, prefix, arrow_tag = _EVENT_DISPATCH.get(event_type, _DEFAULT_DISPATCH)
+
+        self._log_queue.append((ts, prefix, arrow_tag, message, tag))
+        if not self._log_flush_scheduled:
+            self._log_flush_scheduled = True
+            self.after_idle(self._flush_log)
+
+    def _flush_log(self):
+        """
+        Vuelca al widget de log todas las entradas pendientes con un único
+        insert y recorta las líneas más antiguas.
+        """
+        self._log_flush_scheduled = False
+        if self._closed or not self._log_queue:
+            self._log_queue.clear()
+            return
+
+        # Text.insert accepts alternating (chars, tags) pairs in a single call
+        args = []
+        queue = self._log_queue
+        while queue:
+            ts, prefix, arrow_tag, message, tag = queue.popleft()
+            args.extend((f"[{ts}] ", "time", prefix, arrow_tag, message + "\n", tag))
+
+        log = self._log_text
+        log.insert(tk.END, *args)
+        line_count = int(log.index("end-1c").split(".")[0])
+        if line_count > self._log_max_lines:
+            log.delete("1.0", f"{line_count - self._log_max_lines}.0")
+        log.see(tk.END)
 
     def transfer_finished(self, success, message):
         """
@@ -282,10 +384,35 @@ class YappTransferDialog(tk.Toplevel):
         """
         if self._closed:
             return
+        if self._flush_scheduled or self._log_flush_scheduled:
+            # Let this dialog's pending progress/log flushes run first; the
+            # caller must already have pushed its own coalesced progress
+            self.after_idle(self._finalize, success, message)
+        else:
+            self._finalize(success, message)
+
+    def _finalize(self, success, message):
+        """
+        Aplica el estado final de la transferencia.
+
+        Args:
+            success: bool - éxito
+            message: str - mensaje final
+        """
+        if self._closed:
+            return
+        self._finalized = True
+        self._pending_progress = None
+        if self._redraw_job:
+            self.after_cancel(self._redraw_job)
+            self._redraw_job = None
 
         if success:
-            self._draw_progress_bar(100.0)
-            self._lbl_pct.configure(text="100%")
+            # Resize/theme redraws repaint _progress_pct, so it must hold 100%
+            self._progress_pct = 100.0
+            self._var_pct.set("100%")
+            self._show_stats()
+        self._draw_progress_bar(self._progress_pct)
 
         # Enable close, disable cancel
         self._btn_cancel.configure(state=tk.DISABLED)
@@ -296,38 +423,115 @@ class YappTransferDialog(tk.Toplevel):
     # Internal
     # ========================================================================
 
-    def _draw_progress_bar(self, pct):
+    def _show_stats(self):
+        """Muestra la línea de estadísticas la primera vez que hay progreso."""
+        if not self._stats_shown:
+            self._stats_shown = True
+            self._stats_frame.pack(fill=tk.X, pady=(0, 8), after=self._prog_frame)
+
+    def _show_log(self):
+        """Muestra el log de mensajes la primera vez que llega un evento."""
+        if not self._log_shown:
+            self._log_shown = True
+            self._log_label.pack(fill=tk.X, pady=(0, 2), before=self._btn_frame)
+            self._log_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 8),
+                                 before=self._btn_frame)
+
+    def _ensure_tags_configured(self):
+        """Configura los tags de color del log en el primer uso."""
+        if self._tags_done:
+            return
+        self._tags_done = True
+        self._log_text.tag_configure("time", foreground=theme.get("text_dim"),
+                                      font=("Consolas", 8))
+        self._log_text.tag_configure("sent", foreground=theme.get("accent_secondary"),
+                                      font=("Consolas", 9, "bold"))
+        self._log_text.tag_configure("received", foreground=theme.get("accent_primary"),
+                                      font=("Consolas", 9, "bold"))
+        self._log_text.tag_configure("info", foreground=theme.get("text_secondary"),
+                                      font=("Consolas", 9))
+        self._log_text.tag_configure("error", foreground=theme.get("accent_error"),
+                                      font=("Consolas", 9, "bold"))
+        self._log_text.tag_configure("success", foreground=theme.get("accent_secondary"),
+                                      font=("Consolas", 9, "bold"))
+        self._log_text.tag_configure("arrow_tx", foreground=theme.get("accent_secondary"),
+                                      font=("Consolas", 9))
+        self._log_text.tag_configure("arrow_rx", foreground=theme.get("accent_primary"),
+                                      font=("Consolas", 9))
+
+    def _on_log_key(self, event):
+        """Bloquea la edición del log; permite Ctrl+C / Ctrl+A."""
+        if event.state & 0x4 and event.keysym.lower() in ("c", "a"):
+            return None
+        return "break"
+
+    def _on_resize(self, event=None):
+        """Redibuja la barra una sola vez cuando termina una ráfaga de <Configure>."""
+        if self._resize_job:
+            self.after_cancel(self._resize_job)
+        self._resize_job = self.after(30, self._redraw_after_resize)
+
+    def _draw_deferred(self):
+        """Dibuja el último progreso que fue omitido por el límite de FPS."""
+        self._redraw_job = None
+        if not self._closed:
+            self._draw_progress_bar(self._progress_pct)
+            self._last_draw_ts = time.monotonic()
+
+    def _redraw_after_resize(self):
+        """Redibuja la barra con el tamaño final del canvas."""
+        self._resize_job = None
+        if not self._closed:
+            self._draw_progress_bar(self._progress_pct, force=True)
+
+    def _apply_progress_colors(self):
+        """Aplica los colores del tema a los elementos fijos de la barra."""
+        c = self._progress_canvas
+        colors = self._colors
+        c.itemconfig(self._pb_bg, fill=colors["bg_dark"])
+        c.itemconfig(self._pb_fill, fill=colors["accent_primary"])
+        c.itemconfig(self._pb_highlight, fill=colors["accent_secondary"])
+
+    def _draw_progress_bar(self, pct, force=False):
         """
-        Dibuja la barra de progreso en el canvas.
+        Dibuja la barra de progreso en el canvas, moviendo los elementos
+        ya creados en lugar de recrearlos. No hace nada si ni el ancho
+        relleno ni el texto cambian respecto al último dibujo.
 
         Args:
             pct: float - porcentaje (0-100)
+            force: bool - redibujar aunque no haya cambios visibles
         """
         c = self._progress_canvas
-        c.delete("all")
         w = c.winfo_width()
-        h = c.winfo_height()
         if w <= 1:
             return
+        fill_w = int(w * pct / 100)
+        pct_s = f"{pct:.1f}%"
+        if not force and fill_w == self._last_fill_w and pct_s == self._last_pct_s:
+            return
+        self._last_fill_w = fill_w
+        self._last_pct_s = pct_s
+        h = c.winfo_height()
 
         # Background track
-        c.create_rectangle(0, 0, w, h, fill=theme.get("bg_dark"), outline="")
+        c.coords(self._pb_bg, 0, 0, w, h)
 
         # Filled portion
-        fill_w = int(w * pct / 100)
         if fill_w > 0:
-            # Gradient-like effect: darker at left, brighter toward right
-            color = theme.get("accent_primary")
-            c.create_rectangle(0, 0, fill_w, h, fill=color, outline="")
-
+            c.coords(self._pb_fill, 0, 0, fill_w, h)
             # Highlight strip at top
-            highlight = theme.get("accent_secondary")
-            c.create_rectangle(0, 0, fill_w, 3, fill=highlight, outline="")
+            c.coords(self._pb_highlight, 0, 0, fill_w, 3)
+            c.itemconfig(self._pb_fill, state="normal")
+            c.itemconfig(self._pb_highlight, state="normal")
+        else:
+            c.itemconfig(self._pb_fill, state="hidden")
+            c.itemconfig(self._pb_highlight, state="hidden")
 
         # Percentage text
-        text_color = "#ffffff" if pct > 50 else theme.get("text_primary")
-        c.create_text(w // 2, h // 2, text=f"{pct:.1f}%",
-                      fill=text_color, font=("Consolas", 9, "bold"))
+        text_color = "#ffffff" if pct > 50 else self._colors["text_primary"]
+        c.coords(self._pb_text, w // 2, h // 2)
+        c.itemconfig(self._pb_text, text=pct_s, fill=text_color)
 
     def _format_size(self, size):
         """
@@ -339,12 +543,7 @@ class YappTransferDialog(tk.Toplevel):
         Returns:
             str - tamaño formateado (ej: "1.5 KB")
         """
-        if size < 1024:
-            return f"{size} B"
-        elif size < 1024 * 1024:
-            return f"{size / 1024:.1f} KB"
-        else:
-            return f"{size / (1024 * 1024):.2f} MB"
+        return _fmt_size(size)
 
     def _do_cancel(self):
         """Maneja cancelación."""
@@ -354,5 +553,24 @@ class YappTransferDialog(tk.Toplevel):
     def _do_close(self):
         """Cierra el diálogo."""
         self._closed = True
+        if self._redraw_job:
+            self.after_cancel(self._redraw_job)
+            self._redraw_job = None
+        # Late callbacks from the YAPP handler become no-ops
+        self.update_progress = lambda *a, **k: None
+        self.update_file_info = lambda *a, **k: None
+        self.log_event = lambda *a, **k: None
+        self.transfer_finished = lambda *a, **k: None
         self.grab_release()
         self.destroy()
+
+
+@functools.lru_cache(maxsize=256)
+def _fmt_size(size):
+    """Versión cacheada de YappTransferDialog._format_size."""
+    if size < _KB:
+        return f"{size} B"
+    elif size < _MB:
+        return f"{size / _KB:.1f} KB"
+    else:
+        return f"{size / _MB:.2f} MB"
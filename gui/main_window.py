@@ -1,25 +1,30 @@
 import tkinter as tk
 import tkinter.ttk as ttk
-from tkinter import messagebox
+from tkinter import messagebox, filedialog
+import functools
 import os
-import queue
-import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 from gui import theme
 from gui.monitor_panel import MonitorPanel
 from gui.terminal_tab import TerminalTab
 from gui.status_bar import StatusBar
 from gui.toolbar import Toolbar
-from gui.dialogs.settings_dialog import SettingsDialog
-from gui.dialogs.about_dialog import AboutDialog
-from gui.dialogs.help_dialog import HelpDialog
-from gui.dialogs.command_reference import CommandReferenceDialog
-from gui.dialogs.command_search import CommandSearchPopup
 from serial_port.serial_handler import SerialHandler
 from core.config import Config
 from core import tnc_commands
 from core.yapp_handler import YappHandler, YappEvent
-from gui.dialogs.yapp_dialog import YappTransferDialog
+
+DEFAULT_TNC_MODEL = "Generic / TNC-2 Compatible"
+
+# Control-letter wire bytes: "a" -> 0x01 ... "z" -> 0x1A
+_CTRL_BYTES = {c: bytes([i + 1]) for i, c in enumerate("abcdefghijklmnopqrstuvwxyz")}
+_ESC_BYTES = b"\x1b"
+
+# Special key name -> (wire bytes, terminal log line) for _execute_key
+_KEY_BYTES = {f"ctrl+{c}": (b, f"[⚡ Sent CTRL+{c.upper()}]\n") for c, b in _CTRL_BYTES.items()}
+_KEY_BYTES["escape"] = (_ESC_BYTES, "[⚡ Sent ESC]\n")
 
 
 class MainWindow:
@@ -31,7 +36,7 @@ class MainWindow:
         root: tk.Tk - the root Tk window
     """
 
-    POLL_INTERVAL_MS = 50
+    POLL_INTERVAL_MS = 1000   # fallback only; RX normally arrives via <<SerialData>>
     STATS_INTERVAL_MS = 1000
 
     def __init__(self, root):
@@ -40,6 +45,23 @@ class MainWindow:
         self.serial = SerialHandler()
         self._yapp = None          # YappHandler (created per transfer)
         self._yapp_dialog = None   # YappTransferDialog
+        # Latest (transferred, total, filename, file_size) awaiting _flush_yapp_progress
+        self._yapp_progress_data = None
+        self._yapp_progress_scheduled = False
+        # (filename, file_size) last sent to the dialog's update_file_info
+        self._yapp_file_info_pushed = None
+        self._screen_size = None   # (width, height), see _get_screen_size
+        self._last_tx = self._last_rx = 0   # counters last shown in the status bar
+        self._serial_params = {}   # serial settings from config, see _refresh_serial_params
+        self._tnc_model = DEFAULT_TNC_MODEL   # config tnc.model, see _sync_tnc_model
+        # Shared worker pool for command sequences (run off the GUI thread)
+        self._seq_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="tnc-seq")
+        # _seq_programs: dict of id(cmd) -> (cmd, program) - compiled sequences,
+        # see _compile_sequence; cleared when the TNC model is synced
+        self._seq_programs = {}
+        # Single worker for typed commands, so serial writes never block the
+        # GUI and lines still go out in the order they were entered
+        self._tx_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tnc-tx")
 
         # Load saved theme
         saved_theme = self.config.get("appearance", "theme", default="Dark Blue")
@@ -47,9 +69,16 @@ class MainWindow:
 
         self._setup_window()
         theme.apply_theme(self.root)
+        self._theme_var = tk.StringVar(self.root, value=theme.get_current_theme_name())
+        self._theme_var.trace_add("write", self._on_theme_var_changed)
         self._build_menu()
         self._build_ui()
         self._bind_keys()
+        self.serial.set_tk_root(self.root)
+        # Monitor lines are split and classified on the serial reader thread
+        self.serial.set_rx_listener(self.monitor.feed)
+        self.root.bind("<<SerialData>>", lambda e: self._drain_serial())
+        self.root.bind("<<SerialStats>>", lambda e: self._update_counters())
         self._start_polling()
         self._update_from_config()
 
@@ -68,18 +97,27 @@ class MainWindow:
         else:
             self.root.geometry(f"{w}x{h}")
             self.root.update_idletasks()
-            sx = (self.root.winfo_screenwidth() - w) // 2
-            sy = (self.root.winfo_screenheight() - h) // 2
-            self.root.geometry(f"+{sx}+{sy}")
+            sw, sh = self._get_screen_size()
+            self.root.geometry(f"+{(sw - w) // 2}+{(sh - h) // 2}")
 
         self.root.minsize(700, 500)
         self.root.protocol("WM_DELETE_WINDOW", self._on_close)
 
+    def _get_screen_size(self):
+        """Returns: tuple (int, int) - screen width and height, queried once"""
+        if self._screen_size is None:
+            self._screen_size = (self.root.winfo_screenwidth(),
+                                 self.root.winfo_screenheight())
+        return self._screen_size
+
     def _build_menu(self):
         """Builds the menu bar with File, Connection, View (with Theme), Help."""
+        # Theme colors are looked up once and shared by every menu
+        bg_m = theme.get("bg_medium")
+        fg = theme.get("text_primary")
+        ap = theme.get("accent_primary")
         menu_opts = dict(
-            bg=theme.get("bg_medium"), fg=theme.get("text_primary"),
-            activebackground=theme.get("accent_primary"), activeforeground="#000000",
+            bg=bg_m, fg=fg, activebackground=ap, activeforeground="#000000",
             font=("Segoe UI", 9), borderwidth=0, relief="flat"
         )
 
@@ -119,14 +157,10 @@ class MainWindow:
         view_menu.add_command(label="Clear Monitor", command=self._clear_monitor)
         view_menu.add_separator()
 
-        # Theme submenu
-        self._theme_var = tk.StringVar(value=theme.get_current_theme_name())
+        # Theme submenu (selection is handled by the _theme_var trace)
         theme_menu = tk.Menu(view_menu, tearoff=0, **menu_opts)
         for name in theme.get_theme_names():
-            theme_menu.add_radiobutton(
-                label=name, variable=self._theme_var, value=name,
-                command=lambda n=name: self._switch_theme(n)
-            )
+            theme_menu.add_radiobutton(label=name, variable=self._theme_var, value=name)
         view_menu.add_cascade(label="Theme", menu=theme_menu)
         menubar.add_cascade(label="View", menu=view_menu)
 
@@ -141,6 +175,17 @@ class MainWindow:
         menubar.add_cascade(label="Help", menu=help_menu)
 
         self.root.config(menu=menubar)
+        self._menubar = menubar
+        self._menus = [menubar, file_menu, conn_menu, yapp_menu, view_menu,
+                       theme_menu, help_menu]
+
+    def _recolor_menus(self):
+        """Applies the current theme colors to the existing menus in place."""
+        bg_m = theme.get("bg_medium")
+        fg = theme.get("text_primary")
+        ap = theme.get("accent_primary")
+        for menu in self._menus:
+            menu.configure(bg=bg_m, fg=fg, activebackground=ap)
 
     def _build_ui(self):
         """Assembles layout: toolbar + notebook (Connection, Monitor) + status bar."""
@@ -178,7 +223,7 @@ class MainWindow:
         self._notebook.add(self.monitor, text="  ◆ Monitor  ")
 
         # Focus terminal on start
-        self.root.after(100, self.terminal.focus_terminal)
+        self.root.after_idle(self.terminal.focus_terminal)
 
         # Refocus terminal when Connection tab selected
         self._notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
@@ -193,27 +238,41 @@ class MainWindow:
         try:
             idx = self._notebook.index(self._notebook.select())
             if idx == 0:  # Connection tab
-                self.root.after(50, self.terminal.focus_terminal)
+                self.root.after_idle(self.terminal.focus_terminal)
         except Exception:
             pass
 
     def _bind_keys(self):
         """Binds keyboard shortcuts."""
-        self.root.bind("<Control-q>", lambda e: self._on_close())
-        self.root.bind("<Control-Q>", lambda e: self._on_close())
-        self.root.bind("<Control-k>", lambda e: self._connect())
-        self.root.bind("<Control-K>", lambda e: self._connect())
-        self.root.bind("<Control-d>", lambda e: self._disconnect())
-        self.root.bind("<Control-D>", lambda e: self._disconnect())
-        self.root.bind("<Control-l>", lambda e: self._clear_terminal())
-        self.root.bind("<Control-L>", lambda e: self._clear_terminal())
-        self.root.bind("<Control-comma>", lambda e: self._open_settings())
-        self.root.bind("<F1>", lambda e: self._open_help())
-        self.root.bind("<F2>", lambda e: self._open_command_search())
-        self.root.bind("<F3>", lambda e: self._open_command_reference())
+        # Ctrl shortcuts share one binding; keysyms are lowercased so
+        # Ctrl+Q and Ctrl+q (Shift / Caps Lock) dispatch the same way
+        self._ctrl_shortcuts = {
+            "q": self._on_close,
+            "k": self._connect,
+            "d": self._disconnect,
+            "l": self._clear_terminal,
+            "comma": self._open_settings,
+        }
+        self.root.bind("<Control-Key>", self._on_ctrl_key)
+        for seq, fn in (("<F1>", self._open_help),
+                        ("<F2>", self._open_command_search),
+                        ("<F3>", self._open_command_reference)):
+            self.root.bind(seq, lambda e, f=fn: f())
+
+    def _on_ctrl_key(self, event):
+        """Dispatches a Ctrl+key press to its shortcut handler, if any."""
+        fn = self._ctrl_shortcuts.get(event.keysym.lower())
+        if fn:
+            fn()
 
     # -- Theme switching --
 
+    def _on_theme_var_changed(self, *args):
+        """Trace callback for the theme radiobuttons; ignores writes of the active theme."""
+        name = self._theme_var.get()
+        if name != theme.get_current_theme_name():
+            self._switch_theme(name)
+
     def _switch_theme(self, name):
         """
         Switches theme, updates config colors, and refreshes entire UI.
@@ -223,7 +282,7 @@ class MainWindow:
         """
         theme.set_theme(name)
         theme.apply_theme(self.root)
-        self._theme_var.set(name)
+        self._theme_var.set(theme.get_current_theme_name())
 
         # Update config colors from new theme
         color_map = {
@@ -248,38 +307,41 @@ class MainWindow:
 
     def _refresh_all_colors(self):
         """Refreshes colors of all UI components after a theme change."""
-        self.root.configure(bg=theme.get("bg_dark"))
-        self._container.configure(bg=theme.get("bg_dark"))
-        self.terminal.update_appearance()
-        self.monitor.update_appearance()
-        self.toolbar.update_appearance()
-        self.status_bar.update_appearance()
-        self._build_menu()  # Rebuild menu for new colors
+        cs = theme.current()
+        self.root.configure(bg=cs.bg_dark)
+        self._container.configure(bg=cs.bg_dark)
+        self.terminal.update_appearance(cs)
+        self.monitor.update_appearance(cs)
+        self.toolbar.update_appearance(cs)
+        self.status_bar.update_appearance(cs)
+        if self._yapp_dialog:
+            self._yapp_dialog.invalidate_theme_cache()
+        self._recolor_menus()
+        # Keep View > Theme in sync when the theme came from Settings (the
+        # trace ignores writes of the active theme, so this does not recurse)
+        self._theme_var.set(theme.get_current_theme_name())
         callsign = self.config.get("station", "callsign", default="")
         self.status_bar.set_callsign(callsign)
-        tnc_model = self.config.get("tnc", "model", default="Generic / TNC-2 Compatible")
-        self.status_bar.set_tnc(tnc_model)
+        self.status_bar.set_tnc(self._tnc_model)
 
     # -- Serial connection --
 
     def _connect(self):
         """Connects to the serial port using current config."""
-        port = self.config.get("serial", "port", default="")
+        p = self._serial_params
+        port = p["port"]
         if not port or port == "(no ports found)":
             messagebox.showwarning("Connection",
                                    "No serial port configured.\nGo to Settings > Serial Port.",
                                    parent=self.root)
             return
 
-        baudrate = self.config.get("serial", "baudrate", default=9600)
-        databits = self.config.get("serial", "databits", default=8)
-        stopbits = self.config.get("serial", "stopbits", default=1)
-        parity = self.config.get("serial", "parity", default="None")
-        flow = self.config.get("serial", "flow_control", default="None")
+        baudrate, databits = p["baudrate"], p["databits"]
+        stopbits, parity = p["stopbits"], p["parity"]
 
         success, msg = self.serial.connect(
             port=port, baudrate=baudrate, databits=databits,
-            stopbits=stopbits, parity=parity, flow_control=flow
+            stopbits=stopbits, parity=parity, flow_control=p["flow_control"]
         )
 
         if success:
@@ -317,8 +379,8 @@ class MainWindow:
             self.terminal.append("--- Not connected ---\n", tag="error")
             return
 
-        # Send with CR
-        self.serial.send(text + "\r")
+        # Send with CR (write errors surface as __DISCONNECTED__ on the queue)
+        self._tx_pool.submit(self.serial.send, text + "\r")
         # Display sent text
         self.terminal.append_tx(text)
 
@@ -328,44 +390,70 @@ class MainWindow:
         self._poll_stats()
 
     def _poll_serial(self):
-        """Reads from serial queue, displays in terminal and monitor.
-        Routes data to YAPP handler when a transfer is active."""
+        """Fallback poll of the serial queue in case a <<SerialData>> event was missed."""
+        self._drain_serial()
+        self.root.after(self.POLL_INTERVAL_MS, self._poll_serial)
+
+    def _drain_serial(self):
+        """Reads from serial queue, displays in terminal (the monitor is fed
+        directly by the reader thread, see MonitorPanel.feed).
+        Routes data to YAPP handler when a transfer is active.
+        All data chunks queued since the last drain are shown with a single
+        terminal append."""
+        self.serial.ack_notify()
+        rx_parts = []
+        disconnected = False
+        rx_queue = self.serial.rx_queue
+        # Read once: _yapp_on_finished may clear it from the reader thread
+        yapp = self._yapp
         try:
             while True:
-                msg_type, data = self.serial.rx_queue.get_nowait()
+                msg_type, data = rx_queue.popleft()
 
                 if msg_type == "__DISCONNECTED__":
-                    self.status_bar.set_disconnected()
-                    self.toolbar.set_connected(False)
-                    self.terminal.append("--- Connection lost ---\n", tag="error")
-                    self.monitor.append("--- Connection lost ---\n", tag="error")
-                    # Cancel active YAPP transfer on disconnect
-                    if self._yapp and self._yapp.is_active():
-                        self._yapp.cancel()
+                    # Keep draining: items behind the marker were already acked
+                    disconnected = True
                     continue
 
-                if msg_type == "data" and data:
-                    # Route to YAPP handler if transfer active
-                    if self._yapp and self._yapp.is_active():
-                        self._yapp.process_data(data)
+                if msg_type == "data_str" and data:
+                    # Route to YAPP handler if transfer active (latin-1 round-trips)
+                    if yapp and yapp.is_active():
+                        yapp.process_data(data.encode("latin-1"))
                         continue
-
-                    text = data.decode("latin-1", errors="replace")
-                    # Show in terminal (connection tab)
-                    self.terminal.append(text, tag="rx")
-                    # Show in monitor (with auto frame classification)
-                    self.monitor.append(text)
-        except queue.Empty:
+                    rx_parts.append(data)
+        except IndexError:   # queue drained
             pass
-        self.root.after(self.POLL_INTERVAL_MS, self._poll_serial)
+
+        if rx_parts:
+            text = "".join(rx_parts)
+            # Show in terminal (connection tab); the monitor gets it via feed()
+            self.terminal.append(text, tag="rx")
+
+        if disconnected:
+            self.status_bar.set_disconnected()
+            self.toolbar.set_connected(False)
+            self.terminal.append("--- Connection lost ---\n", tag="error")
+            self.monitor.append("--- Connection lost ---\n", tag="error")
+            # Cancel active YAPP transfer on disconnect
+            yapp = self._yapp
+            if yapp and yapp.is_active():
+                yapp.cancel()
 
     def _poll_stats(self):
-        """Updates TX/RX counters in status bar."""
+        """Fallback refresh of the TX/RX counters; normally pushed via <<SerialStats>>."""
         if self.serial.is_connected:
-            stats = self.serial.get_stats()
-            self.status_bar.update_counters(stats["tx_bytes"], stats["rx_bytes"])
+            self._update_counters()
         self.root.after(self.STATS_INTERVAL_MS, self._poll_stats)
 
+    def _update_counters(self):
+        """Updates TX/RX counters in status bar if they changed."""
+        stats = self.serial.get_stats()
+        tx, rx = stats["tx_bytes"], stats["rx_bytes"]
+        if tx == self._last_tx and rx == self._last_rx:
+            return
+        self._last_tx, self._last_rx = tx, rx
+        self.status_bar.update_counters(tx, rx)
+
     # -- Clear actions --
 
     def _clear_terminal(self):
@@ -388,19 +476,19 @@ class MainWindow:
             messagebox.showwarning("YAPP", "Not connected to serial port.",
                                    parent=self.root)
             return
-        if self._yapp and self._yapp.is_active():
+        yapp = self._yapp
+        if yapp and yapp.is_active():
             messagebox.showwarning("YAPP", "A transfer is already in progress.",
                                    parent=self.root)
             return
 
-        from tkinter import filedialog
         filepath = filedialog.askopenfilename(
             parent=self.root, title="Select file to send via YAPP")
         if not filepath:
             return
 
         # Create YAPP handler
-        self._yapp = YappHandler(
+        yapp = self._yapp = YappHandler(
             send_raw=self.serial.send_bytes,
             on_progress=self._yapp_on_progress,
             on_event=self._yapp_on_event,
@@ -408,18 +496,22 @@ class MainWindow:
         )
 
         # Create dialog
+        from gui.dialogs.yapp_dialog import YappTransferDialog
         filename = os.path.basename(filepath)
         file_size = os.path.getsize(filepath)
         self._yapp_dialog = YappTransferDialog(
             self.root, mode="send", filename=filename,
             on_cancel=self._yapp_cancel)
         self._yapp_dialog.update_file_info(filename, file_size)
+        self._yapp_file_info_pushed = (filename, file_size)
 
-        # Start transfer
-        ok, msg = self._yapp.start_send(filepath)
+        # Start transfer; RX bytes go to YAPP directly from the reader thread
+        self.serial.set_data_sink(yapp.process_data)
+        ok, msg = yapp.start_send(filepath)
         if not ok:
             self._yapp_dialog.log_event(YappEvent.ERROR, msg)
             self._yapp_dialog.transfer_finished(False, msg)
+            self.serial.set_data_sink(None)
             self._yapp = None
 
     def _yapp_receive(self):
@@ -428,14 +520,14 @@ class MainWindow:
             messagebox.showwarning("YAPP", "Not connected to serial port.",
                                    parent=self.root)
             return
-        if self._yapp and self._yapp.is_active():
+        yapp = self._yapp
+        if yapp and yapp.is_active():
             messagebox.showwarning("YAPP", "A transfer is already in progress.",
                                    parent=self.root)
             return
 
         download_dir = self.config.get("paths", "yapp_download", default="")
         if not download_dir:
-            from tkinter import filedialog
             download_dir = filedialog.askdirectory(
                 parent=self.root, title="Select download directory for YAPP")
             if not download_dir:
@@ -444,7 +536,7 @@ class MainWindow:
             self.config.save()
 
         # Create YAPP handler
-        self._yapp = YappHandler(
+        yapp = self._yapp = YappHandler(
             send_raw=self.serial.send_bytes,
             on_progress=self._yapp_on_progress,
             on_event=self._yapp_on_event,
@@ -452,15 +544,19 @@ class MainWindow:
         )
 
         # Create dialog
+        from gui.dialogs.yapp_dialog import YappTransferDialog
+        self._yapp_file_info_pushed = None
         self._yapp_dialog = YappTransferDialog(
             self.root, mode="receive", filename="",
             on_cancel=self._yapp_cancel)
 
-        # Start receive
-        ok, msg = self._yapp.start_receive(download_dir)
+        # Start receive; RX bytes go to YAPP directly from the reader thread
+        self.serial.set_data_sink(yapp.process_data)
+        ok, msg = yapp.start_receive(download_dir)
         if not ok:
             self._yapp_dialog.log_event(YappEvent.ERROR, msg)
             self._yapp_dialog.transfer_finished(False, msg)
+            self.serial.set_data_sink(None)
             self._yapp = None
 
     def _yapp_on_progress(self, transferred, total):
@@ -472,12 +568,30 @@ class MainWindow:
             transferred: int - bytes transferidos
             total: int - total bytes
         """
-        if self._yapp_dialog:
-            self.root.after(0, self._yapp_dialog.update_progress, transferred, total)
-            # Actualizar info del archivo si es recepción y acabamos de saber el nombre
-            if self._yapp and self._yapp.filename:
-                self.root.after(0, self._yapp_dialog.update_file_info,
-                                self._yapp.filename, self._yapp.file_size)
+        if not self._yapp_dialog:
+            return
+        yapp = self._yapp
+        # Only the latest values matter; one flush per frame (~60 Hz)
+        self._yapp_progress_data = (transferred, total,
+                                    yapp.filename if yapp else "",
+                                    yapp.file_size if yapp else 0)
+        if not self._yapp_progress_scheduled:
+            self._yapp_progress_scheduled = True
+            self.root.after(16, self._flush_yapp_progress)
+
+    def _flush_yapp_progress(self):
+        """Pushes the latest coalesced YAPP progress to the transfer dialog."""
+        self._yapp_progress_scheduled = False
+        data, self._yapp_progress_data = self._yapp_progress_data, None
+        if not data or not self._yapp_dialog:
+            return
+        transferred, total, filename, file_size = data
+        self._yapp_dialog.update_progress(transferred, total)
+        # Actualizar info del archivo si es recepción y acabamos de saber el nombre
+        fi = (filename, file_size)
+        if filename and fi != self._yapp_file_info_pushed:
+            self._yapp_dialog.update_file_info(filename, file_size)
+            self._yapp_file_info_pushed = fi
 
     def _yapp_on_event(self, event_type, message):
         """
@@ -499,19 +613,34 @@ class MainWindow:
             message: str - mensaje final
         """
         if self._yapp_dialog:
-            self.root.after(0, self._yapp_dialog.transfer_finished, success, message)
-        if self._yapp:
-            self._yapp.reset_to_idle()
-            self._yapp = None
+            self.root.after(0, self._yapp_finish_dialog, success, message)
+        self.serial.set_data_sink(None)
+        yapp, self._yapp = self._yapp, None
+        if yapp:
+            yapp.reset_to_idle()
+
+    def _yapp_finish_dialog(self, success, message):
+        """
+        Finaliza el diálogo YAPP en el hilo GUI, aplicando antes el último
+        progreso pendiente para que no llegue después del estado final.
+
+        Args:
+            success: bool - si fue exitosa
+            message: str - mensaje final
+        """
+        self._flush_yapp_progress()
+        self._yapp_file_info_pushed = None
+        if self._yapp_dialog:
+            self._yapp_dialog.transfer_finished(success, message)
 
     def _yapp_cancel(self):
         """Cancela la transferencia YAPP activa."""
-        if self._yapp and self._yapp.is_active():
-            self._yapp.cancel()
+        yapp = self._yapp
+        if yapp and yapp.is_active():
+            yapp.cancel()
 
     def _yapp_set_download_dir(self):
         """Opens directory picker for YAPP download folder."""
-        from tkinter import filedialog
         current = self.config.get("paths", "yapp_download", default="")
         d = filedialog.askdirectory(parent=self.root, initialdir=current or None,
                                     title="Select YAPP Download Directory")
@@ -520,26 +649,44 @@ class MainWindow:
             self.config.save()
 
     # -- Dialogs --
+    # Dialog modules are imported on first use to keep startup light.
 
     def _open_settings(self):
+        from gui.dialogs.settings_dialog import SettingsDialog
         SettingsDialog(self.root, self.config, on_save=self._on_settings_saved)
 
     def _on_settings_saved(self):
         """Called after settings saved. Applies theme, TNC model, and refreshes UI."""
         saved_theme = self.config.get("appearance", "theme",
                                       default=theme.get_current_theme_name())
-        if saved_theme != theme.get_current_theme_name():
-            theme.set_theme(saved_theme)
-            theme.apply_theme(self.root)
+        # The dialog may already have switched the theme module, so always
+        # apply (apply_theme skips the work when the styles are current)
+        theme.set_theme(saved_theme)
+        theme.apply_theme(self.root)
+        self._refresh_serial_params()
         self._refresh_all_colors()
         self._sync_tnc_model()
 
+    def _refresh_serial_params(self):
+        """Reloads the serial port settings used by _connect from config."""
+        get = self.config.get
+        self._serial_params = {
+            "port": get("serial", "port", default=""),
+            "baudrate": get("serial", "baudrate", default=9600),
+            "databits": get("serial", "databits", default=8),
+            "stopbits": get("serial", "stopbits", default=1),
+            "parity": get("serial", "parity", default="None"),
+            "flow_control": get("serial", "flow_control", default="None"),
+        }
+
     def _sync_tnc_model(self):
         """Updates TNC model, autocomplete setting on terminal tab and status bar."""
-        model = self.config.get("tnc", "model", default="Generic / TNC-2 Compatible")
+        model = self._tnc_model = self.config.get("tnc", "model",
+                                                  default=DEFAULT_TNC_MODEL)
         self.terminal.set_tnc_model(model)
         self.status_bar.set_tnc(model)
         tnc_commands.clear_cache()
+        self._seq_programs.clear()
         # Sync autocomplete toggle
         ac_enabled = self.config.get("tnc", "autocomplete", default=True)
         self.terminal.set_autocomplete_enabled(ac_enabled)
@@ -550,23 +697,28 @@ class MainWindow:
         self.monitor.update_appearance()
         callsign = self.config.get("station", "callsign", default="")
         self.status_bar.set_callsign(callsign)
+        self._refresh_serial_params()
         self._sync_tnc_model()
 
     def _open_about(self):
+        from gui.dialogs.about_dialog import AboutDialog
         AboutDialog(self.root)
 
     def _open_help(self):
+        from gui.dialogs.help_dialog import HelpDialog
         HelpDialog(self.root)
 
     def _open_command_reference(self):
         """Opens the TNC Command Reference dialog (F3)."""
-        model = self.config.get("tnc", "model", default="Generic / TNC-2 Compatible")
+        from gui.dialogs.command_reference import CommandReferenceDialog
+        model = self._tnc_model
         CommandReferenceDialog(self.root, model,
                                on_insert=self._handle_command_insert)
 
     def _open_command_search(self):
         """Opens the quick command search popup (F2)."""
-        model = self.config.get("tnc", "model", default="Generic / TNC-2 Compatible")
+        from gui.dialogs.command_search import CommandSearchPopup
+        model = self._tnc_model
         CommandSearchPopup(self.root, model,
                            on_insert=self._handle_command_insert)
 
@@ -628,16 +780,11 @@ class MainWindow:
         key = cmd.get("key", "").lower().strip()
         desc = cmd.get("desc", cmd.get("cmd", key))
 
-        if key.startswith("ctrl+"):
-            # ctrl+A = 0x01, ctrl+B = 0x02, ..., ctrl+Z = 0x1A
-            letter = key[5:].upper()
-            if len(letter) == 1 and "A" <= letter <= "Z":
-                byte_val = ord(letter) - ord("A") + 1
-                self.serial.send_bytes(bytes([byte_val]))
-                self.terminal.append(f"[⚡ Sent {key.upper()}]\n", tag="system")
-        elif key == "escape":
-            self.serial.send_bytes(bytes([0x1B]))
-            self.terminal.append("[⚡ Sent ESC]\n", tag="system")
+        entry = _KEY_BYTES.get(key)
+        if entry:
+            data, log_line = entry
+            self.serial.send_bytes(data)
+            self.terminal.append(log_line, tag="system")
         elif key == "break":
             self.serial.send_break()
             self.terminal.append("[⚡ Sent BREAK]\n", tag="system")
@@ -646,7 +793,7 @@ class MainWindow:
 
     def _execute_sequence(self, cmd):
         """
-        Executes a multi-step sequence in a background thread.
+        Executes a multi-step sequence on the shared sequence worker pool.
         Steps can be: ctrl key, text, wait.
 
         Args:
@@ -656,47 +803,75 @@ class MainWindow:
             self.terminal.append("--- Not connected ---\n", tag="error")
             return
 
-        steps = cmd.get("steps", [])
+        # The entry keeps cmd alive, so its id() cannot be reused while cached
+        entry = self._seq_programs.get(id(cmd))
+        if entry is None or entry[0] is not cmd:
+            entry = (cmd, self._compile_sequence(cmd.get("steps", [])))
+            self._seq_programs[id(cmd)] = entry
+        program = entry[1]
         desc = cmd.get("desc", cmd.get("cmd", "sequence"))
         self.terminal.append(f"[🔗 Executing: {desc}]\n", tag="system")
 
         def run_steps():
-            """Runs sequence steps in a thread with waits."""
-            import time
-            for step in steps:
-                action = step.get("action", "")
-                if action == "ctrl":
-                    letter = step.get("key", "").upper()
-                    if len(letter) == 1 and "A" <= letter <= "Z":
-                        byte_val = ord(letter) - ord("A") + 1
-                        self.serial.send_bytes(bytes([byte_val]))
-                elif action == "text":
-                    value = step.get("value", "")
-                    self.serial.send(value)
-                elif action == "wait":
-                    ms = step.get("ms", 100)
-                    time.sleep(ms / 1000.0)
-                elif action == "escape":
-                    self.serial.send_bytes(bytes([0x1B]))
-                elif action == "break":
-                    self.serial.send_break()
-
-        thread = threading.Thread(target=run_steps, daemon=True)
-        thread.start()
+            """Runs the compiled sequence in a thread with waits."""
+            for fn, arg in program:
+                if arg is None:
+                    fn()
+                else:
+                    fn(arg)
+
+        self._seq_pool.submit(run_steps)
+
+    def _compile_sequence(self, steps):
+        """
+        Translates sequence steps into a list of calls, done once per command.
+
+        Args:
+            steps: list of dict - step dicts with "action" and its parameters
+
+        Returns: list of tuple (callable, arg) - arg is None for no-argument calls
+        """
+        program = []
+        # Adjacent ctrl/text/escape steps are merged into a single write
+        buf = bytearray()
+
+        def flush():
+            if buf:
+                program.append((self.serial.send_bytes, bytes(buf)))
+                buf.clear()
+
+        for step in steps:
+            action = step.get("action", "")
+            if action == "ctrl":
+                buf += _CTRL_BYTES.get(step.get("key", "").lower(), b"")
+            elif action == "text":
+                buf += step.get("value", "").encode("latin-1", errors="replace")
+            elif action == "escape":
+                buf += _ESC_BYTES
+            elif action == "wait":
+                flush()
+                program.append((time.sleep, step.get("ms", 100) / 1000.0))
+            elif action == "break":
+                flush()
+                # Sequences run on a worker: wait out the break before the next step
+                program.append((functools.partial(self.serial.send_break, blocking=True), None))
+        flush()
+        return program
 
     def _on_close(self):
-        """Saves config, disconnects, and exits."""
+        """Saves config (only if something changed), disconnects, and exits."""
         try:
-            geo = self.root.geometry()
-            parts = geo.split("+")
-            size = parts[0].split("x")
-            self.config.set("window", "width", int(size[0]))
-            self.config.set("window", "height", int(size[1]))
-            self.config.set("window", "x", int(parts[1]))
-            self.config.set("window", "y", int(parts[2]))
+            root = self.root
+            self.config.set("window", "width", root.winfo_width())
+            self.config.set("window", "height", root.winfo_height())
+            self.config.set("window", "x", root.winfo_x())
+            self.config.set("window", "y", root.winfo_y())
             self.config.save()
         except Exception:
             pass
+        self.terminal.save_history()
+        self._seq_pool.shutdown(wait=False, cancel_futures=True)
+        self._tx_pool.shutdown(wait=False, cancel_futures=True)
         if self.serial.is_connected:
             self.serial.disconnect()
         self.root.destroy()
@@ -1,29 +1,27 @@
+import collections
+import functools
+import queue
 import re
 import tkinter as tk
 import tkinter.ttk as ttk
 from gui import theme
 
 
-# Regex patterns to detect AX.25 frame types in TNC monitor output.
+# Control-field tokens that identify AX.25 frame types in TNC monitor output.
 # Matches lines like: [001: DG2GSV > DB0UAL SABM+]
 # or: fm DG2GSV to DB0UAL ctl SABM+
-FRAME_PATTERNS = {
+# Tokens are compared uppercased, with the poll/final and bracket
+# punctuation in _TOKEN_PUNCT stripped from both ends.
+_CTL_MAP = {
     # -- Connection management --
-    "sabm": re.compile(r'\bSABM[E+\-]?\b', re.IGNORECASE),
-    "disc": re.compile(r'\bDISC[+\-]?\b', re.IGNORECASE),
-    "ua":   re.compile(r'\bUA[+\-]?\b', re.IGNORECASE),
-    "dm":   re.compile(r'\bDM[+\-]?\b', re.IGNORECASE),
-    "frmr": re.compile(r'\bFRMR\b', re.IGNORECASE),
-    # -- Information frames --
-    "iframe": re.compile(r'\b[IR]\s*S?\d', re.IGNORECASE),
-    # -- Supervisory frames --
-    "rr":   re.compile(r'\bRR\d', re.IGNORECASE),
-    "rnr":  re.compile(r'\bRNR\d', re.IGNORECASE),
-    "rej":  re.compile(r'\bREJ\d', re.IGNORECASE),
-    "srej": re.compile(r'\bSREJ\d', re.IGNORECASE),
+    "SABM": "connect", "SABME": "connect", "UA": "connect",
+    "DISC": "disconnect", "DM": "disconnect", "FRMR": "disconnect",
     # -- Unnumbered information --
-    "ui":   re.compile(r'\bUI[+\-]?\b', re.IGNORECASE),
+    "UI": "ui",
 }
+# -- Supervisory frames: prefix followed by N(R), e.g. RR3, SREJ1 --
+_SV_PREFIXES = ("SREJ", "RNR", "REJ", "RR")
+_TOKEN_PUNCT = "[]<>(){},:;+-^!"
 
 # Color mapping for each frame type category
 FRAME_COLORS = {
@@ -36,33 +34,70 @@ FRAME_COLORS = {
 }
 
 
-def classify_frame(line):
+# One complete monitor line, newline included
+_LINE_RE = re.compile(r"[^\n]*\n")
+
+# Control field of an uppercased line: after "CTL" or after "> DEST[,DIGIS]"
+_CTL_SLICE_RE = re.compile(r"(?:\bCTL\s+|>\s*\S+\s+)(<?[A-Z][A-Z0-9+\-^]*)")
+
+# Per-frame sequence prefix ("[001: ") stripped before caching so repeats hit
+_PREFIX_RE = re.compile(r"^\s*\[\d+:\s*")
+
+
+def classify_frame(line_upper):
     """
     Classifies a monitor line by AX.25 frame type.
+    The first token that names a frame type decides. Matching is
+    case-sensitive against uppercase tokens, so callers uppercase the line
+    once and can reuse it (e.g. for the callsign filter).
 
     Args:
-        line: str - a single line of monitor output
+        line_upper: str - a single line of monitor output, already uppercased
 
     Returns: str - tag name: "connect", "disconnect", "iframe",
                    "supervisory", "ui", or "default"
     """
-    if FRAME_PATTERNS["sabm"].search(line) or FRAME_PATTERNS["ua"].search(line):
-        return "connect"
-    if (FRAME_PATTERNS["disc"].search(line) or FRAME_PATTERNS["dm"].search(line)
-            or FRAME_PATTERNS["frmr"].search(line)):
-        return "disconnect"
-    if FRAME_PATTERNS["rnr"].search(line) or FRAME_PATTERNS["rej"].search(line) \
-            or FRAME_PATTERNS["srej"].search(line):
-        return "supervisory"
-    if FRAME_PATTERNS["rr"].search(line):
-        return "supervisory"
-    if FRAME_PATTERNS["ui"].search(line):
-        return "ui"
-    if FRAME_PATTERNS["iframe"].search(line):
-        return "iframe"
+    return _classify_cached(_PREFIX_RE.sub("", line_upper).rstrip())
+
+
+@functools.lru_cache(maxsize=2048)
+def _classify_cached(core):
+    """Cached worker for classify_frame; core is the uppercased line without its prefix."""
+    # Fast path: look only at the control field ("ctl SABM+" / "A > B SABM+")
+    m = _CTL_SLICE_RE.search(core)
+    if m:
+        tag = _token_tag(m.group(1))
+        if tag:
+            return tag
+    for tok in core.split():
+        tag = _token_tag(tok)
+        if tag:
+            return tag
     return "default"
 
 
+def _token_tag(tok):
+    """
+    Args:
+        tok: str - one uppercased whitespace-separated token
+
+    Returns: str or None - frame tag if the token is an AX.25 control field
+    """
+    tok = tok.strip(_TOKEN_PUNCT)
+    tag = _CTL_MAP.get(tok)
+    if tag:
+        return tag
+    for prefix in _SV_PREFIXES:
+        if tok.startswith(prefix) and tok[len(prefix):len(prefix) + 1].isdigit():
+            return "supervisory"
+    # I-frame: I or R, optional S, then sequence digits (I12, IS3)
+    if tok[:1] in ("I", "R"):
+        rest = tok[2:] if tok[1:2] == "S" else tok[1:]
+        if rest.isdigit():
+            return "iframe"
+    return None
+
+
 class MonitorPanel(ttk.Frame):
     """
     Scrollable monitor panel with AX.25 frame type coloring and callsign filtering.
@@ -73,6 +108,9 @@ class MonitorPanel(ttk.Frame):
         config: Config - application configuration instance
     """
 
+    TRIM_SLACK = 50   # lines allowed over _max_lines before trimming
+    RENDER_BATCH = 1000   # max lines picked up per <<MonitorLines>> drain
+
     def __init__(self, parent, config):
         super().__init__(parent, style="TFrame")
         self._config = config
@@ -81,12 +119,31 @@ class MonitorPanel(ttk.Frame):
         self._filter_call = ""
         # _line_buffer: str - partial line buffer for incoming data
         self._line_buffer = ""
+        # _line_count: int - newlines inserted since the last trim (approximate line count)
+        self._line_count = 0
+        # _pending: list of (text, tag) - lines waiting for the next _flush_pending
+        self._pending = []
+        self._flush_scheduled = False
+        self._pending_see = False   # a _do_see is scheduled
+        # _following: bool - view is at the end; new lines are inserted right away
+        self._following = True
+        # _backlog: deque of (text, tag or None) - lines received while scrolled back
+        self._backlog = collections.deque(maxlen=self._max_lines)
+        # _feed_buffer: str - partial line buffer for feed() (reader thread only)
+        self._feed_buffer = ""
+        # _render_q: SimpleQueue of (line, frame tag) - classified by feed()
+        self._render_q = queue.SimpleQueue()
+        # _render_notify_pending: bool - a <<MonitorLines>> event is posted but not handled
+        self._render_notify_pending = False
         self._build_ui()
+        self.bind("<<MonitorLines>>", self._drain_render_queue)
 
     def _build_ui(self):
         """Builds the monitor panel: header with filter + scrollable text widget."""
+        t = theme.current()
+
         # Header bar with title and filter
-        header = tk.Frame(self, bg=theme.get("toolbar_bg"), height=28)
+        header = tk.Frame(self, bg=t.toolbar_bg, height=28)
         header.pack(fill=tk.X)
         header.pack_propagate(False)
 
@@ -94,14 +151,14 @@ class MonitorPanel(ttk.Frame):
 
         self._title_label = tk.Label(
             header, text="  ◆  MONITOR", font=("Segoe UI", 9, "bold"),
-            bg=theme.get("toolbar_bg"), fg=theme.get("accent_cyan"), anchor="w"
+            bg=t.toolbar_bg, fg=t.accent_cyan, anchor="w"
         )
         self._title_label.pack(side=tk.LEFT, padx=4)
 
         # Filter entry
         self._filter_label = tk.Label(
             header, text="Filter:", font=("Segoe UI", 8),
-            bg=theme.get("toolbar_bg"), fg=theme.get("text_secondary")
+            bg=t.toolbar_bg, fg=t.text_secondary
         )
         self._filter_label.pack(side=tk.RIGHT, padx=(0, 6))
 
@@ -109,20 +166,20 @@ class MonitorPanel(ttk.Frame):
         self._filter_var.trace_add("write", self._on_filter_change)
         self._filter_entry = tk.Entry(
             header, textvariable=self._filter_var, width=12,
-            bg=theme.get("entry_bg"), fg=theme.get("entry_fg"),
+            bg=t.entry_bg, fg=t.entry_fg,
             font=("Consolas", 9), borderwidth=1, highlightthickness=0,
-            insertbackground=theme.get("accent_secondary"),
+            insertbackground=t.accent_secondary,
         )
         self._filter_entry.pack(side=tk.RIGHT, padx=(0, 4), pady=3)
 
         self._filter_info = tk.Label(
             header, text="Callsign:", font=("Segoe UI", 8),
-            bg=theme.get("toolbar_bg"), fg=theme.get("text_dim")
+            bg=t.toolbar_bg, fg=t.text_dim
         )
         self._filter_info.pack(side=tk.RIGHT, padx=(0, 2))
 
         # Text area
-        text_frame = tk.Frame(self, bg=theme.get("border_color"), bd=1, relief="flat")
+        text_frame = tk.Frame(self, bg=t.border_color, bd=1, relief="flat")
         text_frame.pack(fill=tk.BOTH, expand=True, padx=(1, 1), pady=(0, 1))
 
         self._scrollbar = ttk.Scrollbar(text_frame, orient=tk.VERTICAL,
@@ -130,28 +187,33 @@ class MonitorPanel(ttk.Frame):
         self._scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
         bg = self._config.get("appearance", "monitor", "bg_color",
-                              default=theme.get("monitor_bg"))
+                              default=t.monitor_bg)
         fg = self._config.get("appearance", "monitor", "text_color",
-                              default=theme.get("monitor_fg"))
+                              default=t.monitor_fg)
         font_family = self._config.get("appearance", "font_family", default="Consolas")
         font_size = self._config.get("appearance", "font_size", default=11)
 
         self._text = tk.Text(
             text_frame, bg=bg, fg=fg, font=(font_family, font_size),
             wrap=tk.WORD, state=tk.DISABLED,
-            yscrollcommand=self._scrollbar.set,
+            yscrollcommand=self._on_yscroll,
             borderwidth=0, highlightthickness=0, padx=8, pady=4,
-            insertbackground=theme.get("accent_secondary"),
-            selectbackground=theme.get("bg_highlight"), selectforeground="#ffffff",
+            insertbackground=t.accent_secondary,
+            selectbackground=t.bg_highlight, selectforeground="#ffffff",
         )
         self._text.pack(fill=tk.BOTH, expand=True)
         self._scrollbar.config(command=self._text.yview)
 
         # Configure tags for frame types
-        self._configure_tags()
+        self._configure_tags(t)
+
+    def _configure_tags(self, colors):
+        """
+        Sets up text tags for each frame type and for info/error.
 
-    def _configure_tags(self):
-        """Sets up text tags for each frame type and for info/error."""
+        Args:
+            colors: Theme - theme.current() supplying the info/error fallbacks
+        """
         self._text.tag_configure("connect", foreground=FRAME_COLORS["connect"])
         self._text.tag_configure("disconnect", foreground=FRAME_COLORS["disconnect"])
         self._text.tag_configure("iframe", foreground=FRAME_COLORS["iframe"])
@@ -160,9 +222,9 @@ class MonitorPanel(ttk.Frame):
         self._text.tag_configure("default", foreground=FRAME_COLORS["default"])
         # Legacy tags for system messages
         info_color = self._config.get("appearance", "monitor", "info_color",
-                                      default=theme.get("monitor_info"))
+                                      default=colors.monitor_info)
         error_color = self._config.get("appearance", "monitor", "error_color",
-                                       default=theme.get("monitor_error"))
+                                       default=colors.monitor_error)
         self._text.tag_configure("info", foreground=info_color)
         self._text.tag_configure("error", foreground=error_color)
 
@@ -184,63 +246,266 @@ class MonitorPanel(ttk.Frame):
         """
         if tag:
             # Explicit tag (system messages) - always show
-            self._insert_text(text, tag)
+            if not self._following:
+                self._backlog.append((text, tag))
+                return
+            self._insert_single_system(text, tag)
             return
 
-        # Buffer partial lines and process complete lines
-        self._line_buffer += text
-        while "\n" in self._line_buffer:
-            line, self._line_buffer = self._line_buffer.split("\n", 1)
-            full_line = line + "\n"
+        # Buffer partial lines and process complete lines in one pass
+        buf = self._line_buffer + text
+        end = buf.rfind("\n") + 1
+        self._line_buffer = buf[end:]
+        if not end:
+            return
+        # One search over the whole burst drops it if no line can pass the filter
+        if self._filter_call and self._filter_call not in buf[:end].upper():
+            return
+        lines = _LINE_RE.findall(buf, 0, end)
+        if not self._following:
+            # Scrolled back: park lines unclassified until the view returns to the end
+            self._backlog.extend((line, None) for line in lines)
+            return
+        self._queue_frame_lines(lines)
+
+    def _queue_frame_lines(self, lines):
+        """
+        Filters and classifies complete monitor lines and queues them for insertion.
+
+        Args:
+            lines: iterable of str - lines including their trailing newline
+        """
+        pending = self._pending
+        for full_line in lines:
+            upper = full_line.upper()   # shared by the filter and the classifier
 
             # Apply callsign filter
-            if self._filter_call and self._filter_call not in full_line.upper():
+            if self._filter_call and self._filter_call not in upper:
                 continue
 
-            # Auto-classify and insert
-            frame_tag = classify_frame(full_line)
-            self._insert_text(full_line, frame_tag)
+            # Auto-classify and queue
+            pending.append((full_line, classify_frame(upper)))
+        if pending:
+            self._schedule_flush()
 
-    def _insert_text(self, text, tag):
+    def feed(self, text):
         """
-        Inserts text into the text widget with the given tag, trimming excess lines.
+        Thread-safe counterpart of append() for received data, called from
+        the serial reader thread. Lines are split, filtered and classified on
+        the caller's thread; the GUI thread only inserts them, woken by a
+        <<MonitorLines>> virtual event (at most one pending).
 
         Args:
-            text: str - text to insert
-            tag: str - tag name for coloring
+            text: str - received text
         """
+        buf = self._feed_buffer + text
+        end = buf.rfind("\n") + 1
+        self._feed_buffer = buf[end:]
+        if not end:
+            return
+        filter_call = self._filter_call
+        if filter_call and filter_call not in buf[:end].upper():
+            return
+        put = self._render_q.put
+        queued = False
+        for line in _LINE_RE.findall(buf, 0, end):
+            upper = line.upper()
+            if filter_call and filter_call not in upper:
+                continue
+            put((line, classify_frame(upper)))
+            queued = True
+        if queued and not self._render_notify_pending:
+            self._render_notify_pending = True
+            try:
+                self.event_generate("<<MonitorLines>>", when="tail")
+            except Exception:
+                # Widget destroyed or Tk not ready; the next system message
+                # or feed() picks the lines up
+                self._render_notify_pending = False
+
+    def _drain_render_queue(self, event=None):
+        """
+        <<MonitorLines>> handler: picks up lines queued by feed(). If more
+        than RENDER_BATCH are waiting, the rest follow on an idle callback.
+
+        Args:
+            event: tk.Event or None
+        """
+        self._render_notify_pending = False
+        self._pull_render_queue()
+        if not self._render_q.empty():
+            self.after_idle(self._drain_render_queue)
+
+    def _pull_render_queue(self):
+        """Moves up to RENDER_BATCH classified lines from feed() into the panel."""
+        get = self._render_q.get_nowait
+        items = []
+        try:
+            for _ in range(self.RENDER_BATCH):
+                items.append(get())
+        except queue.Empty:
+            pass
+        if not items:
+            return
+        if not self._following:
+            self._backlog.extend(items)
+            return
+        self._pending.extend(items)
+        self._schedule_flush()
+
+    def _on_yscroll(self, first, last):
+        """
+        yscrollcommand for the text widget: updates the scrollbar and tracks
+        whether the view is following the end of the log.
+        """
+        self._scrollbar.set(first, last)
+        if self._pending_see:
+            # An autoscroll is queued; the view is only briefly off the end
+            return
+        following = float(last) >= 0.999
+        if following and not self._following and self._backlog:
+            self.after_idle(self._replay_backlog)
+        self._following = following
+
+    def _replay_backlog(self):
+        """Queues the lines parked while scrolled back, in arrival order."""
+        items = list(self._backlog)
+        self._backlog.clear()
+        frames = []   # unclassified lines from append()
+        for text, tag in items:
+            if tag is None:
+                frames.append(text)
+                continue
+            self._queue_frame_lines(frames)
+            frames = []
+            if tag in FRAME_COLORS:
+                # Already classified by feed()
+                self._pending.append((text, tag))
+            else:
+                # feed() lines still queued are newer than the backlog
+                self._insert_single_system(text, tag, pull=False)
+        self._queue_frame_lines(frames)
+        if self._pending:
+            self._schedule_flush()
+
+    def _schedule_flush(self):
+        """Schedules _flush_pending once per idle cycle."""
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.after_idle(self._flush_pending)
+
+    def _flush_pending(self):
+        """Idle callback: inserts every queued frame line."""
+        self._flush_scheduled = False
+        pairs, self._pending = self._pending, []
+        if pairs:
+            self._insert_frames_batch(pairs)
+
+    def _insert_single_system(self, text, tag, pull=True):
+        """
+        Inserts one system message right away. Frame lines still queued are
+        inserted first so the message keeps its place in the log.
+
+        Args:
+            text: str - message text
+            tag: str - "info" or "error"
+            pull: bool - also take in lines waiting from feed() first
+        """
+        if pull:
+            self._pull_render_queue()
+        if self._pending:
+            self._flush_pending()
+        self._schedule_see()
         self._text.config(state=tk.NORMAL)
         self._text.insert(tk.END, text, tag)
+        self._trim(text.count("\n"))
+        self._text.config(state=tk.DISABLED)
 
-        line_count = int(self._text.index("end-1c").split(".")[0])
-        if line_count > self._max_lines:
-            self._text.delete("1.0", f"{line_count - self._max_lines}.0")
+    def _insert_frames_batch(self, pairs):
+        """
+        Inserts classified frame lines with a single Text.insert call (one
+        chars/tag pair per line), then trims excess lines and scrolls once.
 
-        self._text.see(tk.END)
+        Args:
+            pairs: list of (str, str) - (line, frame tag)
+        """
+        args = []
+        added = 0
+        for text, tag in pairs:
+            args.append(text)
+            args.append(tag)
+            added += text.count("\n")
+        self._schedule_see()   # before inserting, so _on_yscroll sees it pending
+        self._text.config(state=tk.NORMAL)
+        self._text.insert(tk.END, *args)
+        self._trim(added)
         self._text.config(state=tk.DISABLED)
 
+    def _trim(self, added):
+        """
+        Counts newly inserted lines and trims the oldest ones once the slack
+        over _max_lines is used up. The widget must be in NORMAL state.
+
+        Args:
+            added: int - number of lines just inserted
+        """
+        self._line_count += added
+        if self._line_count > self._max_lines + self.TRIM_SLACK:
+            line_count = int(self._text.index("end-1c").split(".")[0])
+            if line_count > self._max_lines:
+                self._text.delete("1.0", f"{line_count - self._max_lines}.0")
+            self._line_count = int(self._text.index("end-1c").split(".")[0]) - 1
+
+    def _schedule_see(self):
+        """Scrolls to the end once per idle cycle, however many flushes ran."""
+        if not self._pending_see:
+            self._pending_see = True
+            self.after_idle(self._do_see)
+
+    def _do_see(self):
+        """Idle callback for _schedule_see."""
+        if self._pending_see:
+            self._pending_see = False
+            self._text.see(tk.END)
+
     def clear(self):
         """Clears all text from the monitor panel."""
         self._text.config(state=tk.NORMAL)
         self._text.delete("1.0", tk.END)
         self._text.config(state=tk.DISABLED)
         self._line_buffer = ""
+        self._pending = []
+        self._line_count = 0
+        self._backlog.clear()
+        self._following = True
+        try:
+            while True:
+                self._render_q.get_nowait()
+        except queue.Empty:
+            pass
+
+    def update_appearance(self, colors=None):
+        """
+        Reloads colors and font from current config and theme.
 
-    def update_appearance(self):
-        """Reloads colors and font from current config and theme."""
+        Args:
+            colors: Theme or None - theme.current() to use; taken now if None
+        """
+        t = colors or theme.current()
         bg = self._config.get("appearance", "monitor", "bg_color",
-                              default=theme.get("monitor_bg"))
+                              default=t.monitor_bg)
         fg = self._config.get("appearance", "monitor", "text_color",
-                              default=theme.get("monitor_fg"))
+                              default=t.monitor_fg)
         font_family = self._config.get("appearance", "font_family", default="Consolas")
         font_size = self._config.get("appearance", "font_size", default=11)
         self._text.config(bg=bg, fg=fg, font=(font_family, font_size))
-        self._configure_tags()
+        self._configure_tags(t)
 
         # Update header
-        self._header.config(bg=theme.get("toolbar_bg"))
-        self._title_label.config(bg=theme.get("toolbar_bg"), fg=theme.get("accent_cyan"))
-        self._filter_label.config(bg=theme.get("toolbar_bg"), fg=theme.get("text_secondary"))
-        self._filter_info.config(bg=theme.get("toolbar_bg"), fg=theme.get("text_dim"))
-        self._filter_entry.config(bg=theme.get("entry_bg"), fg=theme.get("entry_fg"),
-                                  insertbackground=theme.get("accent_secondary"))
+        tb = t.toolbar_bg
+        self._header.config(bg=tb)
+        self._title_label.config(bg=tb, fg=t.accent_cyan)
+        self._filter_label.config(bg=tb, fg=t.text_secondary)
+        self._filter_info.config(bg=tb, fg=t.text_dim)
+        self._filter_entry.config(bg=t.entry_bg, fg=t.entry_fg,
+                                  insertbackground=t.accent_secondary)
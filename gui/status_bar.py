@@ -1,7 +1,30 @@
+import functools
+import re
 import tkinter as tk
 import tkinter.ttk as ttk
 from gui import theme
 
+# Theme keys read by the status bar, snapshotted once per theme
+_COLOR_KEYS = (
+    "status_bg", "status_fg", "status_connected", "status_disconnected",
+    "text_secondary", "text_dim", "border_color",
+    "accent_primary", "accent_secondary", "accent_warning", "accent_cyan", "accent_orange",
+)
+
+_KB = 1024
+_MB = _KB * _KB
+
+# Manufacturer prefixes stripped from TNC model names for status bar display
+_TNC_PREFIXES = {
+    "Generic / TNC-2 Compatible": "TNC-2",
+    "Kantronics ": "",
+    "AEA / Timewave ": "",
+    "AEA ": "",
+    "SCS ": "",
+}
+_TNC_PREFIX_RE = re.compile(
+    "^(" + "|".join(re.escape(p) for p in _TNC_PREFIXES) + ")")
+
 
 class StatusBar(ttk.Frame):
     """
@@ -13,74 +36,147 @@ class StatusBar(ttk.Frame):
 
     def __init__(self, parent):
         super().__init__(parent, style="Status.TFrame")
+        self._pending_counters = None   # latest (tx, rx) not yet shown
+        self._counters_scheduled = False
+        self._colors = self._snapshot_colors()
+        self._last = {}   # label key -> last options passed to .config()
         self._build_ui()
 
+    @staticmethod
+    def _snapshot_colors():
+        """Returns: dict - current theme colors for every key in _COLOR_KEYS"""
+        return {key: theme.get(key) for key in _COLOR_KEYS}
+
     def _build_ui(self):
         """Builds the status bar with indicator, port info, mode, and counters."""
-        self._bar = tk.Frame(self, bg=theme.get("status_bg"), height=28)
+        # A canvas (rather than a frame) so separators are drawn as lines in the
+        # gaps between labels instead of being separate widgets
+        self._bar = tk.Canvas(self, bg=self._colors["status_bg"], height=28,
+                              highlightthickness=0, borderwidth=0)
         self._bar.pack(fill=tk.X)
         self._bar.pack_propagate(False)
+        self._themed_widgets = []   # widgets whose bg follows status_bg
 
         self._indicator = tk.Label(
             self._bar, text="  ●", font=("Segoe UI", 11),
-            bg=theme.get("status_bg"), fg=theme.get("status_disconnected")
+            bg=self._colors["status_bg"], fg=self._colors["status_disconnected"]
         )
         self._indicator.pack(side=tk.LEFT, padx=(6, 2))
 
         self._status_label = tk.Label(
             self._bar, text="Disconnected", font=("Segoe UI", 9),
-            bg=theme.get("status_bg"), fg=theme.get("status_fg")
+            bg=self._colors["status_bg"], fg=self._colors["status_fg"]
         )
         self._status_label.pack(side=tk.LEFT, padx=(0, 12))
 
-        self._add_sep()
-
         self._port_label = tk.Label(
             self._bar, text="No port", font=("Consolas", 9),
-            bg=theme.get("status_bg"), fg=theme.get("text_dim")
+            bg=self._colors["status_bg"], fg=self._colors["text_dim"]
         )
-        self._port_label.pack(side=tk.LEFT, padx=8)
-
-        self._add_sep()
+        self._port_label.pack(side=tk.LEFT, padx=(13, 8))
 
         self._tnc_label = tk.Label(
             self._bar, text="TNC: ---", font=("Segoe UI", 9),
-            bg=theme.get("status_bg"), fg=theme.get("accent_primary")
+            bg=self._colors["status_bg"], fg=self._colors["accent_primary"]
         )
-        self._tnc_label.pack(side=tk.LEFT, padx=8)
-
-        self._add_sep()
+        self._tnc_label.pack(side=tk.LEFT, padx=(13, 8))
 
         self._mode_label = tk.Label(
             self._bar, text="Mode: ---", font=("Segoe UI", 9),
-            bg=theme.get("status_bg"), fg=theme.get("accent_warning")
+            bg=self._colors["status_bg"], fg=self._colors["accent_warning"]
         )
-        self._mode_label.pack(side=tk.LEFT, padx=8)
+        self._mode_label.pack(side=tk.LEFT, padx=(13, 8))
 
-        self._add_sep()
+        self._var_tx = tk.StringVar(self, value="TX: 0")
+        self._var_rx = tk.StringVar(self, value="RX: 0")
 
         self._tx_label = tk.Label(
-            self._bar, text="TX: 0", font=("Consolas", 9),
-            bg=theme.get("status_bg"), fg=theme.get("accent_secondary")
+            self._bar, textvariable=self._var_tx, font=("Consolas", 9),
+            bg=self._colors["status_bg"], fg=self._colors["accent_secondary"]
         )
-        self._tx_label.pack(side=tk.LEFT, padx=(8, 4))
+        self._tx_label.pack(side=tk.LEFT, padx=(13, 4))
 
         self._rx_label = tk.Label(
-            self._bar, text="RX: 0", font=("Consolas", 9),
-            bg=theme.get("status_bg"), fg=theme.get("accent_cyan")
+            self._bar, textvariable=self._var_rx, font=("Consolas", 9),
+            bg=self._colors["status_bg"], fg=self._colors["accent_cyan"]
         )
         self._rx_label.pack(side=tk.LEFT, padx=(4, 8))
 
         self._call_label = tk.Label(
             self._bar, text="", font=("Consolas", 9, "bold"),
-            bg=theme.get("status_bg"), fg=theme.get("accent_orange")
+            bg=self._colors["status_bg"], fg=self._colors["accent_orange"]
         )
         self._call_label.pack(side=tk.RIGHT, padx=10)
 
-    def _add_sep(self):
-        """Adds a vertical separator line."""
-        sep = tk.Frame(self._bar, width=1, height=16, bg=theme.get("border_color"))
-        sep.pack(side=tk.LEFT, padx=2, pady=6)
+        self._themed_widgets.extend((
+            self._indicator, self._status_label, self._port_label, self._tnc_label,
+            self._mode_label, self._tx_label, self._rx_label, self._call_label,
+        ))
+        # Labels whose fg is reset from the theme on update_appearance
+        self._fg_overrides = [
+            (self._status_label, "status_fg"),
+            (self._tnc_label, "accent_primary"),
+            (self._mode_label, "accent_warning"),
+            (self._tx_label, "accent_secondary"),
+            (self._rx_label, "accent_cyan"),
+            (self._call_label, "accent_orange"),
+        ]
+
+        # Separator lines drawn between these label pairs
+        self._sep_pairs = [
+            (self._status_label, self._port_label),
+            (self._port_label, self._tnc_label),
+            (self._tnc_label, self._mode_label),
+            (self._mode_label, self._tx_label),
+        ]
+        self._sep_lines = [
+            self._bar.create_line(0, 6, 0, 22, fill=self._colors["border_color"])
+            for _ in self._sep_pairs
+        ]
+        self._sep_job = None
+        for _, right in self._sep_pairs:
+            right.bind("<Configure>", self._schedule_separators)
+
+    def _schedule_separators(self, event=None):
+        """Schedules one separator re-layout for the next idle cycle."""
+        if self._sep_job is None:
+            self._sep_job = self.after_idle(self._place_separators)
+
+    def _place_separators(self):
+        """Moves each separator line to the middle of the gap between its labels."""
+        self._sep_job = None
+        for line, (left, right) in zip(self._sep_lines, self._sep_pairs):
+            left_edge = left.winfo_x() + left.winfo_width()
+            x = (left_edge + right.winfo_x()) // 2
+            self._bar.coords(line, x, 6, x, 22)
+
+    def _set_label(self, key, label, **opts):
+        """
+        Configures a label only if the options differ from the last ones set.
+
+        Args:
+            key: str - cache key for the label
+            label: tk.Label - widget to configure
+            **opts: label options (text, fg, ...)
+        """
+        if self._last.get(key) == opts:
+            return
+        label.config(**opts)
+        self._last[key] = opts
+
+    def _set_var(self, key, var, text):
+        """
+        Sets a label text variable only if the text changed.
+
+        Args:
+            key: str - cache key for the label
+            var: tk.StringVar - variable bound to the label
+            text: str - new text
+        """
+        if self._last.get(key) == text:
+            return
+        var.set(text)
+        self._last[key] = text
 
     def set_connected(self, port_info=""):
         """
@@ -89,26 +185,44 @@ class StatusBar(ttk.Frame):
         Args:
             port_info: str - port and settings string (e.g., "COM3 9600,8N1")
         """
-        self._indicator.config(fg=theme.get("status_connected"))
-        self._status_label.config(text="Connected", fg=theme.get("status_connected"))
-        self._port_label.config(text=port_info, fg=theme.get("text_secondary"))
+        self._set_label("indicator", self._indicator, fg=self._colors["status_connected"])
+        self._set_label("status", self._status_label, text="Connected",
+                        fg=self._colors["status_connected"])
+        self._set_label("port", self._port_label, text=port_info,
+                        fg=self._colors["text_secondary"])
 
     def set_disconnected(self):
         """Updates to disconnected state."""
-        self._indicator.config(fg=theme.get("status_disconnected"))
-        self._status_label.config(text="Disconnected", fg=theme.get("status_fg"))
-        self._port_label.config(text="No port", fg=theme.get("text_dim"))
+        self._set_label("indicator", self._indicator, fg=self._colors["status_disconnected"])
+        self._set_label("status", self._status_label, text="Disconnected",
+                        fg=self._colors["status_fg"])
+        self._set_label("port", self._port_label, text="No port",
+                        fg=self._colors["text_dim"])
 
     def update_counters(self, tx_bytes, rx_bytes):
         """
-        Updates TX/RX byte counters.
+        Updates TX/RX byte counters. Rapid calls are coalesced and only the
+        latest values are shown on the next idle cycle.
 
         Args:
             tx_bytes: int - total bytes transmitted
             rx_bytes: int - total bytes received
         """
-        self._tx_label.config(text=f"TX: {self._format_bytes(tx_bytes)}")
-        self._rx_label.config(text=f"RX: {self._format_bytes(rx_bytes)}")
+        self._pending_counters = (tx_bytes, rx_bytes)
+        if not self._counters_scheduled:
+            self._counters_scheduled = True
+            self.after_idle(self._flush_counters)
+
+    def _flush_counters(self):
+        """Pushes the latest pending TX/RX counters to the labels."""
+        pending = self._pending_counters
+        self._pending_counters = None
+        self._counters_scheduled = False
+        if pending is None:
+            return
+        tx_bytes, rx_bytes = pending
+        self._set_var("tx", self._var_tx, f"TX: {self._format_bytes(tx_bytes)}")
+        self._set_var("rx", self._var_rx, f"RX: {self._format_bytes(rx_bytes)}")
 
     def set_tnc(self, tnc_name):
         """
@@ -118,10 +232,9 @@ class StatusBar(ttk.Frame):
             tnc_name: str - TNC model name (e.g., "KAM+", "PK-232")
         """
         # Shorten long names for status bar display
-        short = tnc_name.replace("Generic / TNC-2 Compatible", "TNC-2") \
-                        .replace("Kantronics ", "").replace("AEA / Timewave ", "") \
-                        .replace("AEA ", "").replace("SCS ", "").split(" / ")[0]
-        self._tnc_label.config(text=f"TNC: {short}" if short else "TNC: ---")
+        short = _TNC_PREFIX_RE.sub(lambda m: _TNC_PREFIXES[m.group(1)], tnc_name,
+                                   count=1).split(" / ", 1)[0]
+        self._set_label("tnc", self._tnc_label, text=f"TNC: {short}" if short else "TNC: ---")
 
     def set_mode(self, mode_name):
         """
@@ -130,7 +243,7 @@ class StatusBar(ttk.Frame):
         Args:
             mode_name: str - mode name (e.g., "PACKET", "CW")
         """
-        self._mode_label.config(text=f"Mode: {mode_name}")
+        self._set_label("mode", self._mode_label, text=f"Mode: {mode_name}")
 
     def set_callsign(self, callsign):
         """
@@ -139,25 +252,27 @@ class StatusBar(ttk.Frame):
         Args:
             callsign: str - station callsign
         """
-        self._call_label.config(text=callsign.upper() if callsign else "")
+        self._set_label("call", self._call_label, text=callsign.upper() if callsign else "")
+
+    def update_appearance(self, colors=None):
+        """
+        Reloads all colors from current theme.
 
-    def update_appearance(self):
-        """Reloads all colors from current theme."""
-        bg = theme.get("status_bg")
+        Args:
+            colors: Theme or None - theme.current() to use; taken now if None
+        """
+        self._colors = ({key: getattr(colors, key) for key in _COLOR_KEYS} if colors
+                        else self._snapshot_colors())
+        c = self._colors
+        self._last.clear()   # colors below override any cached fg
+        bg = c["status_bg"]
         self._bar.config(bg=bg)
-        for w in self._bar.winfo_children():
-            try:
-                w.config(bg=bg)
-            except Exception:
-                pass
-        self._indicator.config(bg=bg)
-        self._status_label.config(bg=bg, fg=theme.get("status_fg"))
-        self._port_label.config(bg=bg)
-        self._tnc_label.config(bg=bg, fg=theme.get("accent_primary"))
-        self._mode_label.config(bg=bg, fg=theme.get("accent_warning"))
-        self._tx_label.config(bg=bg, fg=theme.get("accent_secondary"))
-        self._rx_label.config(bg=bg, fg=theme.get("accent_cyan"))
-        self._call_label.config(bg=bg, fg=theme.get("accent_orange"))
+        for w in self._themed_widgets:
+            w.config(bg=bg)
+        for line in self._sep_lines:
+            self._bar.itemconfig(line, fill=c["border_color"])
+        for w, key in self._fg_overrides:
+            w.config(fg=c[key])
 
     @staticmethod
     def _format_bytes(n):
@@ -169,9 +284,15 @@ class StatusBar(ttk.Frame):
 
         Returns: str - formatted string (e.g., "1.2K", "3.4M")
         """
-        if n < 1024:
-            return str(n)
-        elif n < 1024 * 1024:
-            return f"{n / 1024:.1f}K"
-        else:
-            return f"{n / (1024 * 1024):.1f}M"
+        return _fmt_bytes(n)
+
+
+@functools.lru_cache(maxsize=256)
+def _fmt_bytes(n):
+    """Cached worker for StatusBar._format_bytes."""
+    if n < _KB:
+        return str(n)
+    elif n < _MB:
+        return f"{n / _KB:.1f}K"
+    else:
+        return f"{n / _MB:.1f}M"
@@ -1,9 +1,60 @@
+import collections
+import functools
+import itertools
+import json
+import os
 import tkinter as tk
 import tkinter.ttk as ttk
 from gui import theme
 from gui.autocomplete import AutocompleteTooltip
 from core import tnc_commands
 
+# Keysyms that may be pressed anywhere in TX (navigation and modifiers)
+_NAV_KEYSYMS = frozenset({
+    "Left", "Right", "Home", "End", "Delete",
+    "Shift_L", "Shift_R", "Control_L", "Control_R", "Alt_L", "Alt_R",
+    "Super_L", "Super_R", "Caps_Lock", "Tab", "Prior", "Next", "Escape",
+})
+# Keys swallowed in RX (kept in NORMAL state), besides printable characters
+_RX_EDIT_KEYSYMS = frozenset({"BackSpace", "Delete", "Return", "KP_Enter", "Tab", "Insert"})
+# Ctrl+<key> chords (lowercase) that the Text class binds to edits: delete
+# char/line/word, open line, transpose
+_RX_CTRL_EDIT_KEYSYMS = frozenset({"h", "d", "k", "o", "t", "backspace", "delete"})
+
+# Context menu icon per command type
+_TYPE_ICON = {"text": "⌨", "key": "⚡", "sequence": "🔗"}
+_DEFAULT_ICON = "⌨"
+
+# Context menu entry, resolved once per (model, category) by _cmd_cache
+# payload: dict - the original command definition passed to _execute_command
+MenuCommand = collections.namedtuple("MenuCommand", "type cmd label hint payload")
+
+
+# Command definitions are static per model, so the context menu reads them
+# through these memoized wrappers instead of walking the JSON data each rebuild.
+@functools.lru_cache(maxsize=None)
+def _cat_cache(model):
+    """Returns tuple of str - category names for a TNC model."""
+    return tuple(tnc_commands.get_categories(model))
+
+
+@functools.lru_cache(maxsize=None)
+def _cmd_cache(model, cat):
+    """
+    Returns the commands of a category with their menu labels resolved.
+
+    Returns: tuple of MenuCommand
+    """
+    entries = []
+    for cmd in tnc_commands.get_commands(model, cat):
+        cmd_type = cmd.get("type", "text")
+        hint = cmd.get("syntax", cmd.get("key", ""))
+        label = f"{_TYPE_ICON.get(cmd_type, _DEFAULT_ICON)}  {cmd['cmd']}"
+        if hint:
+            label += f"   [{hint}]"
+        entries.append(MenuCommand(cmd_type, cmd["cmd"], label, hint, cmd))
+    return tuple(entries)
+
 
 class TerminalTab(ttk.Frame):
     """
@@ -18,6 +69,9 @@ class TerminalTab(ttk.Frame):
         on_send: callable(str) or None - called with text when Enter is pressed
     """
 
+    # Command history is kept across sessions next to the user config
+    HISTORY_PATH = os.path.join(os.path.expanduser("~"), ".pytncterm", "tx_history.json")
+
     def __init__(self, parent, config, on_send=None, on_execute=None):
         super().__init__(parent, style="TFrame")
         self._config = config
@@ -26,32 +80,44 @@ class TerminalTab(ttk.Frame):
         self._on_execute = on_execute
         # _tnc_model: str - current TNC model name for context menu
         self._tnc_model = config.get("tnc", "model", default="Generic / TNC-2 Compatible")
-        # _history: list of str - command history
-        self._history = []
-        # _history_idx: int - current position in history (-1 = new input)
-        self._history_idx = -1
+        # _history: deque of str - command history, oldest entries dropped
+        self._history = collections.deque(
+            maxlen=config.get("tnc", "history_size", default=1000))
+        self._load_history()
+        # _history_idx: int or None - current position in history (None = new input)
+        self._history_idx = None
         # _current_input: str - saved input when browsing history
         self._current_input = ""
         # _input_mark: str - tk text mark at the start of the current editable line
         self._input_mark = "input_start"
         self._max_lines_rx = 2000
         self._max_lines_tx = 500
+        # _rx_lines / _tx_lines: int - newline count in each zone, kept in Python
+        # so trimming never has to ask the widget
+        self._rx_lines = 0
+        self._tx_lines = 0
+        # _ctx_menu: tk.Menu or None - right-click menu, built on first use
+        self._ctx_menu = None
+        # _colors_cache: dict or None - result of _get_colors until invalidated
+        self._colors_cache = None
+        # _rx_queue: deque of (text, tag) - RX appends waiting for _flush_rx
+        self._rx_queue = collections.deque()
+        self._rx_flush_pending = False
         self._build_ui()
-        # Autocomplete tooltip (created after UI so _tx_text exists)
-        self._autocomplete = AutocompleteTooltip(
-            self._tx_text, self._tnc_model,
-            on_insert=self.insert_command
-        )
-        # Apply saved preference
-        ac_enabled = config.get("tnc", "autocomplete", default=True)
-        self._autocomplete.enabled = ac_enabled
+        # _autocomplete: AutocompleteTooltip or None - created on the first
+        # keystroke while enabled, see _ensure_autocomplete
+        self._autocomplete = None
+        self._ac_enabled = config.get("tnc", "autocomplete", default=True)
 
     def _get_colors(self):
         """
         Returns: dict with color values from config, falling back to theme.
         Keys: bg, rx, tx, sys, font, size, tx_bg, tx_fg, prompt
+        Cached until invalidate_colors() (update_appearance does this).
         """
-        return {
+        if self._colors_cache is not None:
+            return self._colors_cache
+        self._colors_cache = {
             "bg": self._config.get("appearance", "channel", "bg_color",
                                    default=theme.get("channel_bg")),
             "rx": self._config.get("appearance", "channel", "rx_color",
@@ -69,6 +135,11 @@ class TerminalTab(ttk.Frame):
             "prompt": self._config.get("appearance", "input", "prompt_color",
                                        default=theme.get("input_prompt")),
         }
+        return self._colors_cache
+
+    def invalidate_colors(self):
+        """Drops the cached _get_colors result after a config or theme change."""
+        self._colors_cache = None
 
     def _build_ui(self):
         """Builds the split terminal using PanedWindow with RX (top) and TX (bottom)."""
@@ -106,7 +177,7 @@ class TerminalTab(ttk.Frame):
 
         self._rx_text = tk.Text(
             rx_frame, bg=c["bg"], fg=c["rx"], font=(c["font"], c["size"]),
-            wrap=tk.WORD, state=tk.DISABLED,
+            wrap=tk.WORD, insertwidth=0,
             yscrollcommand=self._rx_scrollbar.set,
             borderwidth=0, highlightthickness=0, padx=8, pady=4,
             insertbackground=theme.get("accent_secondary"),
@@ -114,6 +185,10 @@ class TerminalTab(ttk.Frame):
         )
         self._rx_text.pack(fill=tk.BOTH, expand=True)
         self._rx_scrollbar.config(command=self._rx_text.yview)
+        # RX stays in NORMAL state (no toggling per append); block user edits
+        self._rx_text.bind("<Key>", self._rx_readonly_key)
+        for seq in ("<<Paste>>", "<<PasteSelection>>", "<<Cut>>", "<<Clear>>"):
+            self._rx_text.bind(seq, lambda e: "break")
 
         # RX text tags
         self._rx_text.tag_configure("tx", foreground=c["tx"])
@@ -171,8 +246,8 @@ class TerminalTab(ttk.Frame):
         self._paned.add(rx_container, stretch="always")
         self._paned.add(tx_container, stretch="never")
 
-        # Set initial sash position after layout is computed
-        self.after(50, self._set_initial_sash)
+        # Set initial sash position once the paned window gets a real size
+        self._sash_bind_id = self._paned.bind("<Configure>", self._set_initial_sash)
 
         # Key bindings on TX
         self._tx_text.bind("<Return>", self._handle_enter)
@@ -184,15 +259,19 @@ class TerminalTab(ttk.Frame):
         # Right-click context menu (Button-3 on Linux/Windows, Button-2 on Mac)
         self._tx_text.bind("<Button-3>", self._show_context_menu)
 
-    def _set_initial_sash(self):
+    def _set_initial_sash(self, event):
         """
         Sets the initial sash position so TX takes ~25% of the total height.
-        Called after the widget is mapped and has a real size.
+        One-shot <Configure> handler: unbinds itself once the paned window
+        has a real size.
+
+        Args:
+            event: tk.Event - <Configure> event with the new height
         """
-        self.update_idletasks()
-        total = self._paned.winfo_height()
+        total = event.height
         if total > 100:
             self._paned.sash_place(0, 0, int(total * 0.75))
+            self._paned.unbind("<Configure>", self._sash_bind_id)
 
     def _handle_enter(self, event):
         """
@@ -209,19 +288,19 @@ class TerminalTab(ttk.Frame):
 
         if input_text.strip():
             self._history.append(input_text)
-        self._history_idx = -1
+        self._history_idx = None
         self._current_input = ""
 
-        # Delete the raw input and replace with formatted sent line
-        self._tx_text.delete(self._input_mark, "end-1c")
-        self._tx_text.insert(self._input_mark, ">> ", "sent_prompt")
-        self._tx_text.insert(tk.END, input_text + "\n", "sent")
+        # Replace the raw input with the formatted sent line (one Tcl call)
+        self._tx_text.replace(self._input_mark, "end-1c",
+                              ">> ", "sent_prompt", input_text + "\n", "sent")
 
-        # Trim excess lines
-        line_count = int(self._tx_text.index("end-1c").split(".")[0])
-        if line_count > self._max_lines_tx:
-            excess = line_count - self._max_lines_tx
-            self._tx_text.delete("1.0", f"{excess}.0")
+        # Trim excess lines (10% hysteresis so the delete is amortized)
+        self._tx_lines += input_text.count("\n") + 1
+        if self._tx_lines > self._max_lines_tx * 1.1:
+            excess = self._tx_lines - self._max_lines_tx
+            self._tx_text.delete("1.0", f"{excess + 1}.0")
+            self._tx_lines -= excess
 
         # Update input mark to current end position (new input line)
         self._tx_text.mark_set(self._input_mark, "end-1c")
@@ -256,11 +335,11 @@ class TerminalTab(ttk.Frame):
 
         Returns: str "break" if non-printable key in history area
         """
+        if self._autocomplete is None and self._ac_enabled:
+            self._ensure_autocomplete()
+
         # Allow navigation and modifier keys everywhere
-        if event.keysym in ("Left", "Right", "Home", "End", "Delete",
-                            "Shift_L", "Shift_R", "Control_L", "Control_R",
-                            "Alt_L", "Alt_R", "Caps_Lock", "Tab",
-                            "Prior", "Next"):
+        if event.keysym in _NAV_KEYSYMS:
             return None
         if event.state & 0x4:  # Control key held (Ctrl+C, Ctrl+V, etc.)
             return None
@@ -293,7 +372,7 @@ class TerminalTab(ttk.Frame):
         """
         if not self._history:
             return "break"
-        if self._history_idx == -1:
+        if self._history_idx is None:
             self._current_input = self._tx_text.get(self._input_mark, "end-1c")
             self._history_idx = len(self._history) - 1
         elif self._history_idx > 0:
@@ -301,7 +380,7 @@ class TerminalTab(ttk.Frame):
         else:
             return "break"
 
-        self._replace_input(self._history[self._history_idx])
+        self._set_input(self._history[self._history_idx])
         return "break"
 
     def _handle_down(self, event):
@@ -313,27 +392,48 @@ class TerminalTab(ttk.Frame):
 
         Returns: str "break"
         """
-        if self._history_idx == -1:
+        if self._history_idx is None:
             return "break"
         if self._history_idx < len(self._history) - 1:
             self._history_idx += 1
-            self._replace_input(self._history[self._history_idx])
+            self._set_input(self._history[self._history_idx])
         else:
-            self._history_idx = -1
-            self._replace_input(self._current_input)
+            self._history_idx = None
+            self._set_input(self._current_input)
         return "break"
 
-    def _replace_input(self, text):
+    def _load_history(self):
+        """Loads the command history saved by save_history, if any."""
+        try:
+            with open(self.HISTORY_PATH, "r", encoding="utf-8") as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return
+        if isinstance(saved, list):
+            self._history.extend(cmd for cmd in saved if isinstance(cmd, str))
+
+    def save_history(self):
+        """Writes the command history to HISTORY_PATH (called on app close)."""
+        try:
+            os.makedirs(os.path.dirname(self.HISTORY_PATH), exist_ok=True)
+            with open(self.HISTORY_PATH, "w", encoding="utf-8") as f:
+                json.dump(list(self._history), f)
+        except OSError:
+            pass
+
+    def _set_input(self, text, focus=False):
         """
         Replaces only the current input line (after input_mark) with new text.
 
         Args:
             text: str - replacement text
+            focus: bool - also give keyboard focus to TX
         """
-        self._tx_text.delete(self._input_mark, "end-1c")
-        self._tx_text.insert(self._input_mark, text)
+        self._tx_text.replace(self._input_mark, "end-1c", text)
         self._tx_text.mark_set("insert", "end")
         self._tx_text.see(tk.END)
+        if focus:
+            self._tx_text.focus_set()
 
     def append(self, text, tag=None):
         """
@@ -343,19 +443,64 @@ class TerminalTab(ttk.Frame):
             text: str - text to append
             tag: str or None - optional tag ("rx", "tx", "system", "error")
         """
-        self._rx_text.config(state=tk.NORMAL)
-        if tag:
-            self._rx_text.insert(tk.END, text, tag)
-        else:
-            self._rx_text.insert(tk.END, text)
+        self._rx_queue.append((text, tag or ""))
+        if not self._rx_flush_pending:
+            self._rx_flush_pending = True
+            self.after_idle(self._flush_rx)
+
+    def _flush_rx(self):
+        """
+        Inserts all queued RX text in one Text.insert call, joining runs that
+        share a tag, then trims and scrolls once. The view only follows the
+        new text if it was already at the end, so scroll-back is not yanked.
+        """
+        self._rx_flush_pending = False
+        if not self._rx_queue:
+            return
+        items = list(self._rx_queue)
+        self._rx_queue.clear()
+        args = []
+        for tag, group in itertools.groupby(items, key=lambda item: item[1]):
+            args.append("".join(text for text, _ in group))
+            args.append(tag)
+
+        following = self._rx_text.yview()[1] > 0.999
+        self._rx_text.insert(tk.END, *args)
+
+        # Trim excess lines (10% hysteresis so the delete is amortized)
+        self._rx_lines += sum(text.count("\n") for text in args[::2])
+        if self._rx_lines > self._max_lines_rx * 1.1:
+            excess = self._rx_lines - self._max_lines_rx
+            self._rx_text.delete("1.0", f"{excess + 1}.0")
+            self._rx_lines -= excess
+
+        if following:
+            self._rx_text.see(tk.END)
 
-        # Trim excess lines
-        line_count = int(self._rx_text.index("end-1c").split(".")[0])
-        if line_count > self._max_lines_rx:
-            self._rx_text.delete("1.0", f"{line_count - self._max_lines_rx}.0")
+    def _rx_readonly_key(self, event):
+        """
+        Keeps RX read-only: swallows printable characters and editing keys,
+        lets everything else through so navigation, copy and the window's
+        Ctrl/F-key shortcuts keep working while RX has focus.
+
+        Args:
+            event: tk.Event
 
-        self._rx_text.see(tk.END)
-        self._rx_text.config(state=tk.DISABLED)
+        Returns: str "break" for keys that would edit the text, else None
+        """
+        keysym = event.keysym
+        if event.state & 0x4:  # Control key held
+            if keysym.lower() in _RX_CTRL_EDIT_KEYSYMS:
+                # Skip the Text class edit, but still deliver the chord to the
+                # toplevel bindings (Ctrl+K and Ctrl+D are app shortcuts)
+                self.winfo_toplevel().event_generate(f"<Control-Key-{keysym}>")
+                return "break"
+            return None
+        if keysym in _RX_EDIT_KEYSYMS:
+            return "break"
+        if event.char and event.char.isprintable() and not event.state & 0x8:
+            return "break"   # Alt+<char> is left to menus (Text ignores it)
+        return None
 
     def append_tx(self, text):
         """
@@ -368,13 +513,14 @@ class TerminalTab(ttk.Frame):
 
     def clear(self):
         """Clears the RX zone."""
-        self._rx_text.config(state=tk.NORMAL)
+        self._rx_queue.clear()
+        self._rx_lines = 0
         self._rx_text.delete("1.0", tk.END)
-        self._rx_text.config(state=tk.DISABLED)
 
     def clear_tx(self):
         """Clears the TX zone history and resets input mark."""
         self._tx_text.delete("1.0", tk.END)
+        self._tx_lines = 0
         self._tx_text.mark_set(self._input_mark, "1.0")
 
     def focus_terminal(self):
@@ -382,34 +528,44 @@ class TerminalTab(ttk.Frame):
         self._tx_text.focus_set()
         self._tx_text.mark_set("insert", "end")
 
-    def update_appearance(self):
-        """Reloads colors and font from current config and theme."""
+    def update_appearance(self, colors=None):
+        """
+        Reloads colors and font from current config and theme.
+
+        Args:
+            colors: Theme or None - theme.current() to use; taken now if None
+        """
+        t = colors or theme.current()
+        self.invalidate_colors()
         c = self._get_colors()
+        font = (c["font"], c["size"])
+        ins = t.accent_secondary
+        sel = t.bg_highlight
+        bar = t.toolbar_bg
 
         # RX zone
-        self._rx_text.config(bg=c["bg"], fg=c["rx"], font=(c["font"], c["size"]),
-                             insertbackground=theme.get("accent_secondary"),
-                             selectbackground=theme.get("bg_highlight"))
+        self._rx_text.config(bg=c["bg"], fg=c["rx"], font=font,
+                             insertbackground=ins, selectbackground=sel)
         self._rx_text.tag_configure("tx", foreground=c["tx"])
         self._rx_text.tag_configure("rx", foreground=c["rx"])
         self._rx_text.tag_configure("system", foreground=c["sys"])
-        self._rx_text.tag_configure("error", foreground=theme.get("accent_error"))
+        self._rx_text.tag_configure("error", foreground=t.accent_error)
 
         # TX zone
-        self._tx_text.config(bg=c["tx_bg"], fg=c["tx_fg"], font=(c["font"], c["size"]),
-                             insertbackground=theme.get("accent_secondary"),
-                             selectbackground=theme.get("bg_highlight"))
-        self._tx_text.tag_configure("sent", foreground=theme.get("text_dim"))
-        self._tx_text.tag_configure("sent_prompt", foreground=theme.get("accent_warning"))
+        self._tx_text.config(bg=c["tx_bg"], fg=c["tx_fg"], font=font,
+                             insertbackground=ins, selectbackground=sel)
+        self._tx_text.tag_configure("sent", foreground=t.text_dim)
+        self._tx_text.tag_configure("sent_prompt", foreground=t.accent_warning)
 
         # Containers and headers
-        self._paned.config(bg=theme.get("border_accent"))
-        self._rx_container.config(bg=theme.get("bg_dark"))
-        self._tx_container.config(bg=theme.get("bg_dark"))
-        self._rx_header.config(bg=theme.get("toolbar_bg"))
-        self._rx_label.config(bg=theme.get("toolbar_bg"), fg=theme.get("accent_cyan"))
-        self._tx_header.config(bg=theme.get("toolbar_bg"))
-        self._tx_label.config(bg=theme.get("toolbar_bg"), fg=theme.get("accent_secondary"))
+        self._paned.config(bg=t.border_accent)
+        self._rx_container.config(bg=t.bg_dark)
+        self._tx_container.config(bg=t.bg_dark)
+        self._rx_header.config(bg=bar)
+        self._rx_label.config(bg=bar, fg=t.accent_cyan)
+        self._tx_header.config(bg=bar)
+        self._tx_label.config(bg=bar, fg=ins)
+        self._invalidate_context_menu()   # rebuilt with the new colors on next use
 
     # -- TNC command context menu --
 
@@ -421,7 +577,9 @@ class TerminalTab(ttk.Frame):
             model_name: str - TNC model name (e.g., "Kantronics KAM / KAM+")
         """
         self._tnc_model = model_name
-        self._autocomplete.set_model(model_name)
+        if self._autocomplete is not None:
+            self._autocomplete.set_model(model_name)
+        self._invalidate_context_menu()
 
     def set_autocomplete_enabled(self, enabled):
         """
@@ -430,16 +588,52 @@ class TerminalTab(ttk.Frame):
         Args:
             enabled: bool
         """
-        self._autocomplete.enabled = enabled
+        self._ac_enabled = enabled
+        if self._autocomplete is not None:
+            self._autocomplete.enabled = enabled
+
+    def _ensure_autocomplete(self):
+        """
+        Creates the autocomplete tooltip. Its own <KeyRelease> binding then
+        picks up the release of the key that triggered the creation.
+
+        Returns: AutocompleteTooltip
+        """
+        if self._autocomplete is None:
+            self._autocomplete = AutocompleteTooltip(
+                self._tx_text, self._tnc_model,
+                on_insert=self.insert_command
+            )
+        return self._autocomplete
 
     def _show_context_menu(self, event):
         """
-        Builds and shows the right-click context menu with TNC commands
-        organized by category. Menu content depends on the selected TNC model.
+        Shows the right-click context menu, building it on first use.
 
         Args:
             event: tk.Event - mouse event with x_root, y_root coordinates
         """
+        if self._ctx_menu is None:
+            self._ctx_menu = self._build_context_menu()
+        menu = self._ctx_menu
+        try:
+            menu.tk_popup(event.x_root, event.y_root)
+        finally:
+            menu.grab_release()
+
+    def _invalidate_context_menu(self):
+        """Discards the cached context menu (TNC model or theme changed)."""
+        if self._ctx_menu is not None:
+            self._ctx_menu.destroy()
+            self._ctx_menu = None
+
+    def _build_context_menu(self):
+        """
+        Builds the right-click context menu with TNC commands organized by
+        category. Menu content depends on the selected TNC model.
+
+        Returns: tk.Menu
+        """
         menu_opts = dict(
             bg=theme.get("bg_medium"), fg=theme.get("text_primary"),
             activebackground=theme.get("accent_primary"), activeforeground="#000000",
@@ -455,37 +649,24 @@ class TerminalTab(ttk.Frame):
         menu.add_separator()
 
         # TNC commands by category
-        categories = tnc_commands.get_categories(self._tnc_model)
-        for cat in categories:
-            commands = tnc_commands.get_commands(self._tnc_model, cat)
+        model = self._tnc_model
+        for cat in _cat_cache(model):
+            commands = _cmd_cache(model, cat)
             if not commands:
                 continue
 
             sub = tk.Menu(menu, tearoff=0, **menu_opts)
-            for cmd in commands:
-                cmd_type = cmd.get("type", "text")
-                type_icon = {"text": "⌨", "key": "⚡", "sequence": "🔗"}.get(cmd_type, "⌨")
-                label = f"{type_icon}  {cmd['cmd']}"
-                # Add syntax/key hint
-                hint = cmd.get("syntax", cmd.get("key", ""))
-                if hint:
-                    label += f"   [{hint}]"
-
-                # Capture cmd in closure
+            for ct in commands:
                 sub.add_command(
-                    label=label,
-                    command=lambda c=cmd: self._execute_command(c)
+                    label=ct.label,
+                    command=functools.partial(self._execute_command, ct.payload)
                 )
             menu.add_cascade(label=f"  {cat}", menu=sub)
 
         menu.add_separator()
         menu.add_command(label="🔍 Search command...  F2",
                          command=self._request_search)
-
-        try:
-            menu.tk_popup(event.x_root, event.y_root)
-        finally:
-            menu.grab_release()
+        return menu
 
     def _ctx_cut(self):
         """Cut selected text in TX."""
@@ -539,8 +720,4 @@ class TerminalTab(ttk.Frame):
         Args:
             text: str - command syntax to insert (e.g., "PACLEN {n}")
         """
-        self._tx_text.delete(self._input_mark, "end-1c")
-        self._tx_text.insert(self._input_mark, text)
-        self._tx_text.mark_set("insert", "end")
-        self._tx_text.see(tk.END)
-        self._tx_text.focus_set()
+        self._set_input(text, focus=True)
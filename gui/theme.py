@@ -1,8 +1,10 @@
 """
 Theme system with multiple predefined themes and dynamic switching.
-Each theme is a dict with all color definitions used across the application.
-Call get(key) to retrieve a color from the active theme.
+Each theme is an immutable Theme record with all color definitions used
+across the application. Call get(key) to retrieve a color from the active
+theme, or current() and read attributes (t.bg_dark) when fetching many.
 """
+import collections
 
 THEMES = {
     "Dark Blue": {
@@ -151,7 +153,19 @@ THEMES = {
     },
 }
 
-_current = THEMES["Dark Blue"].copy()
+
+class Theme(collections.namedtuple("Theme", tuple(THEMES["Dark Blue"]))):
+    """
+    Immutable color set of one theme; each color key is an attribute
+    (e.g. t.bg_dark). Building one from a dict with a missing or unknown
+    key fails at import, so typos are caught early.
+    """
+    __slots__ = ()
+
+
+THEMES = {name: Theme(**colors) for name, colors in THEMES.items()}
+
+_current = THEMES["Dark Blue"]
 _current_name = "Dark Blue"
 
 
@@ -175,7 +189,18 @@ def get(key, fallback="#ff00ff"):
 
     Returns: str - hex color value
     """
-    return _current.get(key, fallback)
+    # Only real color fields: tuple methods like "count"/"index" are not keys
+    if key in Theme._fields:
+        return getattr(_current, key)
+    return fallback
+
+
+def current():
+    """
+    Returns: Theme - the current theme's colors, for callers that read many
+    keys at once (e.g. update_appearance after a theme switch)
+    """
+    return _current
 
 
 def set_theme(name):
@@ -189,19 +214,132 @@ def set_theme(name):
     """
     global _current, _current_name
     if name in THEMES:
-        _current = THEMES[name].copy()
+        _current = THEMES[name]
         _current_name = name
         return True
     return False
 
 
+# Fonts shared by all themes' ttk styles
+_FONT_SMALL = ("Segoe UI", 9)
+_FONT_NORMAL = ("Segoe UI", 10)
+_FONT_BOLD_SMALL = ("Segoe UI", 9, "bold")
+_FONT_BOLD = ("Segoe UI", 10, "bold")
+_FONT_TITLE = ("Segoe UI", 14, "bold")
+
+# _STYLE_SPECS: dict of theme name -> list of (method, style, kwargs), built
+# on first use by _build_style_specs and replayed by apply_theme
+_STYLE_SPECS = {}
+# _last_applied_name: str or None - theme whose styles apply_theme last set
+_last_applied_name = None
+
+
+def _build_style_specs(t):
+    """
+    Builds the ttk style table for a theme.
+
+    Args:
+        t: Theme - theme colors
+
+    Returns: list of (method: str, style: str, kwargs: dict) where method is
+             "configure" or "map"
+    """
+    return [
+        ("configure", "TFrame", dict(background=t.bg_dark)),
+        ("configure", "Toolbar.TFrame", dict(background=t.toolbar_bg)),
+        ("configure", "Status.TFrame", dict(background=t.status_bg)),
+        ("configure", "Dialog.TFrame", dict(background=t.dialog_bg)),
+        ("configure", "Light.TFrame", dict(background=t.bg_light)),
+
+        ("configure", "TLabel", dict(background=t.bg_dark, foreground=t.text_primary,
+                                     font=_FONT_NORMAL)),
+        ("configure", "Status.TLabel", dict(background=t.status_bg,
+                                            foreground=t.status_fg, font=_FONT_SMALL)),
+        ("configure", "Title.TLabel", dict(background=t.dialog_bg,
+                                           foreground=t.accent_primary, font=_FONT_TITLE)),
+        ("configure", "Heading.TLabel", dict(background=t.dialog_bg,
+                                             foreground=t.accent_cyan, font=_FONT_BOLD)),
+        ("configure", "Dialog.TLabel", dict(background=t.dialog_bg,
+                                            foreground=t.text_primary, font=_FONT_NORMAL)),
+
+        ("configure", "TButton", dict(background=t.button_bg, foreground=t.button_fg,
+                                      font=_FONT_SMALL, padding=(10, 4), borderwidth=0)),
+        ("map", "TButton", dict(
+            background=[("active", t.button_active), ("pressed", t.accent_primary)],
+            foreground=[("active", "#ffffff")])),
+
+        ("configure", "Toolbar.TButton", dict(background=t.toolbar_btn_bg,
+                                              foreground=t.toolbar_btn_fg,
+                                              font=_FONT_SMALL, padding=(12, 5),
+                                              borderwidth=0)),
+        ("map", "Toolbar.TButton", dict(
+            background=[("disabled", t.bg_dark),
+                        ("active", t.toolbar_btn_active),
+                        ("pressed", t.accent_primary)],
+            foreground=[("disabled", t.text_dim), ("active", "#ffffff")])),
+
+        ("configure", "Accent.TButton", dict(background=t.accent_primary,
+                                             foreground="#000000",
+                                             font=_FONT_BOLD_SMALL, padding=(12, 5))),
+        ("map", "Accent.TButton", dict(background=[("active", t.bg_highlight)])),
+
+        ("configure", "TEntry", dict(fieldbackground=t.entry_bg, foreground=t.entry_fg,
+                                     insertcolor=t.accent_secondary, borderwidth=1,
+                                     padding=(5, 3))),
+
+        ("configure", "TCombobox", dict(fieldbackground=t.entry_bg,
+                                        foreground=t.entry_fg,
+                                        background=t.button_bg,
+                                        arrowcolor=t.text_secondary,
+                                        borderwidth=1, padding=(3, 3))),
+        ("map", "TCombobox", dict(
+            fieldbackground=[("readonly", t.entry_bg)],
+            foreground=[("readonly", t.entry_fg)])),
+
+        ("configure", "TNotebook", dict(background=t.bg_dark, borderwidth=0)),
+        ("configure", "TNotebook.Tab", dict(background=t.tab_bg, foreground=t.tab_fg,
+                                            font=_FONT_SMALL, padding=(14, 6),
+                                            borderwidth=0)),
+        ("map", "TNotebook.Tab", dict(
+            background=[("selected", t.tab_selected_bg)],
+            foreground=[("selected", t.tab_selected_fg)])),
+
+        ("configure", "TLabelframe", dict(background=t.dialog_bg,
+                                          foreground=t.accent_primary,
+                                          borderwidth=1, relief="groove")),
+        ("configure", "TLabelframe.Label", dict(background=t.dialog_bg,
+                                                foreground=t.accent_primary,
+                                                font=_FONT_BOLD)),
+
+        ("configure", "TSeparator", dict(background=t.border_color)),
+
+        ("configure", "Vertical.TScrollbar", dict(background=t.scrollbar_bg,
+                                                  troughcolor=t.bg_dark,
+                                                  arrowcolor=t.text_secondary,
+                                                  borderwidth=0)),
+        ("map", "Vertical.TScrollbar", dict(background=[("active", t.scrollbar_fg)])),
+
+        ("configure", "TCheckbutton", dict(background=t.dialog_bg,
+                                           foreground=t.text_primary,
+                                           font=_FONT_NORMAL)),
+        ("map", "TCheckbutton", dict(background=[("active", t.dialog_bg)])),
+    ]
+
+
 def apply_theme(root):
     """
-    Applies the current theme to all ttk widget styles.
+    Applies the current theme to all ttk widget styles. Does nothing if
+    this theme is already applied to root, so callers may call it freely.
 
     Args:
         root: tk.Tk - the root window
     """
+    global _last_applied_name
+    if _last_applied_name == _current_name and getattr(root, "_pytncterm_styled", False):
+        return
+    root._pytncterm_styled = True
+    _last_applied_name = _current_name
+
     import tkinter.ttk as ttk
 
     style = ttk.Style(root)
@@ -210,70 +348,14 @@ def apply_theme(root):
     except Exception:
         pass
 
-    t = _current
-
-    style.configure("TFrame", background=t["bg_dark"])
-    style.configure("Toolbar.TFrame", background=t["toolbar_bg"])
-    style.configure("Status.TFrame", background=t["status_bg"])
-    style.configure("Dialog.TFrame", background=t["dialog_bg"])
-
-    style.configure("TLabel", background=t["bg_dark"], foreground=t["text_primary"],
-                     font=("Segoe UI", 10))
-    style.configure("Status.TLabel", background=t["status_bg"], foreground=t["status_fg"],
-                     font=("Segoe UI", 9))
-    style.configure("Title.TLabel", background=t["dialog_bg"], foreground=t["accent_primary"],
-                     font=("Segoe UI", 14, "bold"))
-    style.configure("Heading.TLabel", background=t["dialog_bg"], foreground=t["accent_cyan"],
-                     font=("Segoe UI", 10, "bold"))
-    style.configure("Dialog.TLabel", background=t["dialog_bg"], foreground=t["text_primary"],
-                     font=("Segoe UI", 10))
-
-    style.configure("TButton", background=t["button_bg"], foreground=t["button_fg"],
-                     font=("Segoe UI", 9), padding=(10, 4), borderwidth=0)
-    style.map("TButton",
-              background=[("active", t["button_active"]), ("pressed", t["accent_primary"])],
-              foreground=[("active", "#ffffff")])
-
-    style.configure("Toolbar.TButton", background=t["toolbar_btn_bg"],
-                     foreground=t["toolbar_btn_fg"],
-                     font=("Segoe UI", 9), padding=(12, 5), borderwidth=0)
-    style.map("Toolbar.TButton",
-              background=[("active", t["toolbar_btn_active"]),
-                          ("pressed", t["accent_primary"])],
-              foreground=[("active", "#ffffff")])
-
-    style.configure("Accent.TButton", background=t["accent_primary"], foreground="#000000",
-                     font=("Segoe UI", 9, "bold"), padding=(12, 5))
-    style.map("Accent.TButton", background=[("active", t["bg_highlight"])])
-
-    style.configure("TEntry", fieldbackground=t["entry_bg"], foreground=t["entry_fg"],
-                     insertcolor=t["accent_secondary"], borderwidth=1, padding=(5, 3))
-
-    style.configure("TCombobox", fieldbackground=t["entry_bg"], foreground=t["entry_fg"],
-                     background=t["button_bg"], arrowcolor=t["text_secondary"],
-                     borderwidth=1, padding=(3, 3))
-    style.map("TCombobox",
-              fieldbackground=[("readonly", t["entry_bg"])],
-              foreground=[("readonly", t["entry_fg"])])
-
-    style.configure("TNotebook", background=t["bg_dark"], borderwidth=0)
-    style.configure("TNotebook.Tab", background=t["tab_bg"], foreground=t["tab_fg"],
-                     font=("Segoe UI", 9), padding=(14, 6), borderwidth=0)
-    style.map("TNotebook.Tab",
-              background=[("selected", t["tab_selected_bg"])],
-              foreground=[("selected", t["tab_selected_fg"])])
-
-    style.configure("TLabelframe", background=t["dialog_bg"], foreground=t["accent_primary"],
-                     borderwidth=1, relief="groove")
-    style.configure("TLabelframe.Label", background=t["dialog_bg"],
-                     foreground=t["accent_primary"], font=("Segoe UI", 10, "bold"))
-
-    style.configure("TSeparator", background=t["border_color"])
-
-    style.configure("Vertical.TScrollbar", background=t["scrollbar_bg"],
-                     troughcolor=t["bg_dark"], arrowcolor=t["text_secondary"], borderwidth=0)
-    style.map("Vertical.TScrollbar", background=[("active", t["scrollbar_fg"])])
-
-    style.configure("TCheckbutton", background=t["dialog_bg"], foreground=t["text_primary"],
-                     font=("Segoe UI", 10))
-    style.map("TCheckbutton", background=[("active", t["dialog_bg"])])
+    specs = _STYLE_SPECS.get(_current_name)
+    if specs is None:
+        specs = _STYLE_SPECS[_current_name] = _build_style_specs(_current)
+
+    configure = style.configure
+    style_map = style.map
+    for method, name, kw in specs:
+        if method == "configure":
+            configure(name, **kw)
+        else:
+            style_map(name, **kw)
@@ -16,6 +16,9 @@ class Toolbar(ttk.Frame):
         super().__init__(parent, style="Toolbar.TFrame")
         self._callbacks = callbacks or {}
         self._buttons = {}
+        # _spacers / _separators: list of tk.Frame - recolored by update_appearance
+        self._spacers = []
+        self._separators = []
         self._build_ui()
 
     def _build_ui(self):
@@ -24,7 +27,9 @@ class Toolbar(ttk.Frame):
         self._bar.pack(fill=tk.X)
         self._bar.pack_propagate(False)
 
-        tk.Frame(self._bar, width=6, bg=theme.get("toolbar_bg")).pack(side=tk.LEFT)
+        spacer = tk.Frame(self._bar, width=6, bg=theme.get("toolbar_bg"))
+        spacer.pack(side=tk.LEFT)
+        self._spacers.append(spacer)
 
         self._add_button("connect", "⚡ Connect", "connect")
         self._add_button("disconnect", "✕ Disconnect", "disconnect")
@@ -36,31 +41,26 @@ class Toolbar(ttk.Frame):
 
     def _add_button(self, name, text, callback_key):
         """
-        Creates a toolbar button.
+        Creates a toolbar button. Colors, including hover and disabled, come
+        from the Toolbar.TButton style (see theme.apply_theme).
 
         Args:
             name: str - internal button name
             text: str - button label
             callback_key: str - key in self._callbacks
         """
-        btn = tk.Button(
-            self._bar, text=text, font=("Segoe UI", 9),
-            bg=theme.get("toolbar_btn_bg"), fg=theme.get("toolbar_btn_fg"),
-            activebackground=theme.get("toolbar_btn_active"), activeforeground="#ffffff",
-            bd=0, padx=12, pady=4, cursor="hand2",
-            highlightthickness=0, relief="flat",
+        btn = ttk.Button(
+            self._bar, text=text, style="Toolbar.TButton", cursor="hand2",
             command=self._callbacks.get(callback_key, lambda: None)
         )
         btn.pack(side=tk.LEFT, padx=2, pady=4)
-        btn.bind("<Enter>", lambda e, b=btn: b.config(bg=theme.get("toolbar_btn_active")))
-        btn.bind("<Leave>", lambda e, b=btn: b.config(
-            bg=theme.get("toolbar_btn_bg") if b["state"] != "disabled" else theme.get("bg_dark")))
         self._buttons[name] = btn
 
     def _add_separator(self):
         """Adds a vertical separator."""
         sep = tk.Frame(self._bar, width=1, height=22, bg=theme.get("border_color"))
         sep.pack(side=tk.LEFT, padx=6, pady=8)
+        self._separators.append(sep)
 
     def set_connected(self, connected):
         """
@@ -69,30 +69,20 @@ class Toolbar(ttk.Frame):
         Args:
             connected: bool
         """
-        if connected:
-            self._buttons["connect"].config(state="disabled",
-                                            bg=theme.get("bg_dark"), fg=theme.get("text_dim"))
-            self._buttons["disconnect"].config(state="normal",
-                                               bg=theme.get("toolbar_btn_bg"),
-                                               fg=theme.get("toolbar_btn_fg"))
-        else:
-            self._buttons["connect"].config(state="normal",
-                                            bg=theme.get("toolbar_btn_bg"),
-                                            fg=theme.get("toolbar_btn_fg"))
-            self._buttons["disconnect"].config(state="disabled",
-                                               bg=theme.get("bg_dark"), fg=theme.get("text_dim"))
+        self._buttons["connect"].state(["disabled" if connected else "!disabled"])
+        self._buttons["disconnect"].state(["!disabled" if connected else "disabled"])
 
-    def update_appearance(self):
-        """Reloads all colors from current theme."""
-        self._bar.config(bg=theme.get("toolbar_bg"))
-        for name, btn in self._buttons.items():
-            if btn["state"] != "disabled":
-                btn.config(bg=theme.get("toolbar_btn_bg"), fg=theme.get("toolbar_btn_fg"),
-                           activebackground=theme.get("toolbar_btn_active"))
-            else:
-                btn.config(bg=theme.get("bg_dark"), fg=theme.get("text_dim"))
-        # Update spacers and separators
-        for w in self._bar.winfo_children():
-            if isinstance(w, tk.Frame):
-                w.config(bg=theme.get("toolbar_bg") if w.winfo_width() < 10
-                         else theme.get("border_color"))
+    def update_appearance(self, colors=None):
+        """
+        Reloads all colors from current theme.
+
+        Args:
+            colors: Theme or None - theme.current() to use; taken now if None
+        """
+        t = colors or theme.current()
+        self._bar.config(bg=t.toolbar_bg)
+        # Buttons follow the Toolbar.TButton style; update spacers and separators
+        for w in self._spacers:
+            w.config(bg=t.toolbar_bg)
+        for w in self._separators:
+            w.config(bg=t.border_color)
@@ -1,3 +1,5 @@
+import collections
+import os
 import tkinter as tk
 import tkinter.ttk as ttk
 from gui import theme
@@ -13,27 +15,50 @@ class InputBar(ttk.Frame):
         on_send: callable(str) - callback when user presses Enter
     """
 
+    HISTORY_SIZE = 500
+    # History is kept across sessions (one command per line)
+    HISTORY_PATH = os.path.join(os.path.expanduser("~"), ".pytncterm_history")
+
     def __init__(self, parent, config, on_send=None):
         super().__init__(parent, style="TFrame")
         self._config = config
         self._on_send = on_send
-        self._history = []
+        # _history: deque of str - command history, oldest entries dropped
+        self._history = collections.deque(maxlen=self.HISTORY_SIZE)
+        self._load_history()
         self._history_idx = -1
         self._current_input = ""
+        # _cached_colors: dict or None - result of _get_colors until invalidated
+        self._cached_colors = None
+        # _font_regular / _font_bold: tuple - entry and prompt fonts
+        self._font_regular = self._font_bold = None
         self._build_ui()
 
     def _get_colors(self):
-        """Returns: dict with input bar color values from config, falling back to theme."""
-        return {
+        """
+        Returns: dict with input bar color values from config, falling back to
+        theme. Cached until invalidate_appearance() is called.
+        """
+        if self._cached_colors is not None:
+            return self._cached_colors
+        t = theme.current()
+        c = self._cached_colors = {
             "bg": self._config.get("appearance", "input", "bg_color",
-                                   default=theme.get("input_bg")),
+                                   default=t.input_bg),
             "fg": self._config.get("appearance", "input", "text_color",
-                                   default=theme.get("input_fg")),
+                                   default=t.input_fg),
             "prompt": self._config.get("appearance", "input", "prompt_color",
-                                       default=theme.get("input_prompt")),
+                                       default=t.input_prompt),
             "font": self._config.get("appearance", "font_family", default="Consolas"),
             "size": self._config.get("appearance", "font_size", default=11),
         }
+        self._font_regular = (c["font"], c["size"])
+        self._font_bold = (c["font"], c["size"], "bold")
+        return c
+
+    def invalidate_appearance(self):
+        """Drops cached colors and fonts (call after a theme or config change)."""
+        self._cached_colors = None
 
     def _build_ui(self):
         """Builds the input bar: prompt label + entry widget."""
@@ -47,13 +72,13 @@ class InputBar(ttk.Frame):
 
         self._prompt_label = tk.Label(
             self._inner, text=" => ", bg=c["bg"], fg=c["prompt"],
-            font=(c["font"], c["size"], "bold")
+            font=self._font_bold
         )
         self._prompt_label.pack(side=tk.LEFT)
 
         self._entry = tk.Entry(
             self._inner, bg=c["bg"], fg=c["fg"],
-            font=(c["font"], c["size"]),
+            font=self._font_regular,
             insertbackground=c["fg"], borderwidth=0, highlightthickness=0,
             selectbackground=theme.get("bg_highlight"), selectforeground="#ffffff",
         )
@@ -101,15 +126,36 @@ class InputBar(ttk.Frame):
             self._entry.insert(0, self._current_input)
         return "break"
 
+    def _load_history(self):
+        """Loads the saved command history, if any (one command per line)."""
+        try:
+            with open(self.HISTORY_PATH, "r", encoding="utf-8") as f:
+                self._history.extend(line.rstrip("\n") for line in f if line.strip())
+        except OSError:
+            pass
+
+    def save_history(self):
+        """Writes the command history to HISTORY_PATH (called on destroy)."""
+        try:
+            with open(self.HISTORY_PATH, "w", encoding="utf-8") as f:
+                f.writelines(cmd + "\n" for cmd in self._history)
+        except OSError:
+            pass
+
+    def destroy(self):
+        """Saves the command history, then destroys the widget."""
+        self.save_history()
+        super().destroy()
+
     def focus_input(self):
         """Sets keyboard focus to the input entry."""
         self._entry.focus_set()
 
     def update_appearance(self):
         """Reloads colors and font from current config and theme."""
+        self.invalidate_appearance()
         c = self._get_colors()
-        self._entry.config(bg=c["bg"], fg=c["fg"], font=(c["font"], c["size"]),
+        self._entry.config(bg=c["bg"], fg=c["fg"], font=self._font_regular,
                            insertbackground=c["fg"])
-        self._prompt_label.config(bg=c["bg"], fg=c["prompt"],
-                                  font=(c["font"], c["size"], "bold"))
+        self._prompt_label.config(bg=c["bg"], fg=c["prompt"], font=self._font_bold)
         self._inner.config(bg=c["bg"])
@@ -1,5 +1,6 @@
+import collections
+import logging
 import threading
-import queue
 import time
 
 try:
@@ -9,20 +10,58 @@ try:
 except ImportError:
     SERIAL_AVAILABLE = False
 
+if SERIAL_AVAILABLE:
+    _PARITY_MAP = {
+        "None": serial.PARITY_NONE,
+        "Even": serial.PARITY_EVEN,
+        "Odd": serial.PARITY_ODD,
+        "Mark": serial.PARITY_MARK,
+        "Space": serial.PARITY_SPACE,
+    }
+    _STOPBITS_MAP = {
+        1: serial.STOPBITS_ONE,
+        1.5: serial.STOPBITS_ONE_POINT_FIVE,
+        2: serial.STOPBITS_TWO,
+    }
+
+# Flow control setting -> (rtscts, xonxoff)
+_FLOW_MAP = {
+    "None": (False, False),
+    "RTS/CTS": (True, False),
+    "XON/XOFF": (False, True),
+}
+
+logger = logging.getLogger(__name__)
+
+# _ports_cache: (float, list of str) or None - time.monotonic() of the last
+# port enumeration and its result, see SerialHandler.list_ports
+_ports_cache = None
+
 
 class SerialHandler:
     """
     Manages serial port communication in a background thread.
-    Data received is placed in a queue for the GUI to consume.
+    Data received is decoded (latin-1) and placed in a queue for the GUI to consume.
     
     Attributes:
-        rx_queue: queue.Queue - received data (bytes) from the serial port
+        rx_queue: collections.deque - received data (str) from the serial port.
+            One producer (the reader thread, or send() on error) appends and
+            one consumer (the GUI thread) pops from the left; deque.append and
+            popleft are atomic under the GIL, so no lock is needed.
         is_connected: bool - whether the port is currently open
     """
 
+    STATS_NOTIFY_INTERVAL = 0.25
+    # Seconds a port enumeration is reused by list_ports()
+    PORTS_CACHE_TTL = 2.0
+    # RX reads are batched for up to RX_BATCH_WINDOW seconds after the first
+    # byte, or until RX_BATCH_BYTES are buffered, before being handed on
+    RX_BATCH_BYTES = 4096
+    RX_BATCH_WINDOW = 0.005
+
     def __init__(self):
-        # rx_queue: queue.Queue - incoming data from serial port
-        self.rx_queue = queue.Queue()
+        # rx_queue: collections.deque - incoming data from serial port
+        self.rx_queue = collections.deque()
         # _serial: serial.Serial or None - the serial port instance
         self._serial = None
         # _read_thread: threading.Thread or None - background reader thread
@@ -35,17 +74,112 @@ class SerialHandler:
         self._tx_bytes = 0
         # _rx_bytes: int - total bytes received
         self._rx_bytes = 0
+        # _tk_root: tk.Tk or None - notified with <<SerialData>> when data is queued
+        self._tk_root = None
+        # _notify_pending: bool - a <<SerialData>> event is posted but not yet handled
+        self._notify_pending = False
+        # _data_sink: callable or None - if set, receives RX bytes instead of rx_queue
+        self._data_sink = None
+        # _rx_listener: callable or None - also receives decoded RX text on the reader thread
+        self._rx_listener = None
+        # _last_stats_notify: float - time.monotonic() of the last <<SerialStats>> event
+        self._last_stats_notify = 0.0
+
+    def set_tk_root(self, root):
+        """
+        Registers the Tk root to notify with a <<SerialData>> virtual event
+        whenever something is put into rx_queue.
+
+        Args:
+            root: tk.Tk or None - root window, or None to stop notifications
+        """
+        self._tk_root = root
+
+    def set_data_sink(self, fn):
+        """
+        Routes received bytes straight to a callback on the reader thread,
+        bypassing rx_queue and the GUI (used during YAPP transfers).
+
+        Args:
+            fn: callable(bytes) or None - data consumer, or None to restore rx_queue
+        """
+        self._data_sink = fn
+
+    def set_rx_listener(self, fn):
+        """
+        Registers a callback that receives each decoded RX chunk on the reader
+        thread, in addition to rx_queue (e.g. for the monitor's classification).
+        It is skipped while a data sink is set.
+
+        Args:
+            fn: callable(str) or None - must be thread-safe; None to remove
+        """
+        self._rx_listener = fn
+
+    def ack_notify(self):
+        """
+        Marks the pending <<SerialData>> event as handled. The GUI calls this
+        before draining rx_queue so that later data posts a new event.
+        """
+        self._notify_pending = False
+
+    def _enqueue(self, item):
+        """
+        Puts an item into rx_queue and notifies the GUI (at most one pending event).
+
+        Args:
+            item: tuple - ("data_str", str) or ("__DISCONNECTED__", None)
+        """
+        self.rx_queue.append(item)
+        # Once disconnect() clears _running the GUI thread may be blocked in
+        # join(); posting would stall this thread until the join times out
+        if self._tk_root is None or self._notify_pending or not self._running:
+            return
+        self._notify_pending = True
+        try:
+            self._tk_root.event_generate("<<SerialData>>", when="tail")
+        except Exception:
+            # Root destroyed or Tk not ready; the GUI fallback poll picks it up
+            self._notify_pending = False
+
+    def _notify_stats(self):
+        """
+        Posts a <<SerialStats>> virtual event to the GUI after bytes moved,
+        throttled to at most one every STATS_NOTIFY_INTERVAL seconds.
+        """
+        if self._tk_root is None or not self._running:
+            return
+        now = time.monotonic()
+        if now - self._last_stats_notify < self.STATS_NOTIFY_INTERVAL:
+            return
+        self._last_stats_notify = now
+        try:
+            self._tk_root.event_generate("<<SerialStats>>", when="tail")
+        except Exception:
+            pass
 
     @staticmethod
-    def list_ports():
+    def list_ports(force=False):
         """
-        Lists available serial ports on the system.
-        
+        Lists available serial ports on the system. Enumeration can be slow
+        (registry/WMI on Windows), so the result is reused for
+        PORTS_CACHE_TTL seconds.
+
+        Args:
+            force: bool - enumerate again even if the cached list is fresh
+
         Returns: list of str - port device names (e.g., ["COM3", "/dev/ttyUSB0"])
         """
+        global _ports_cache
         if not SERIAL_AVAILABLE:
             return []
-        return [p.device for p in serial.tools.list_ports.comports()]
+        now = time.monotonic()
+        if (not force and _ports_cache is not None
+                and now - _ports_cache[0] < SerialHandler.PORTS_CACHE_TTL):
+            return list(_ports_cache[1])
+        ports = [p.device for p in serial.tools.list_ports.comports()]
+        _ports_cache = (now, ports)
+        return list(ports)
 
     def connect(self, port, baudrate=9600, databits=8, stopbits=1, parity="None", flow_control="None"):
         """
@@ -67,30 +201,18 @@ class SerialHandler:
         if self.is_connected:
             self.disconnect()
 
-        parity_map = {
-            "None": serial.PARITY_NONE,
-            "Even": serial.PARITY_EVEN,
-            "Odd": serial.PARITY_ODD,
-            "Mark": serial.PARITY_MARK,
-            "Space": serial.PARITY_SPACE,
-        }
-
-        stopbits_map = {
-            1: serial.STOPBITS_ONE,
-            1.5: serial.STOPBITS_ONE_POINT_FIVE,
-            2: serial.STOPBITS_TWO,
-        }
+        rtscts, xonxoff = _FLOW_MAP.get(flow_control, (False, False))
 
         try:
             self._serial = serial.Serial(
                 port=port,
                 baudrate=baudrate,
                 bytesize=databits,
-                stopbits=stopbits_map.get(stopbits, serial.STOPBITS_ONE),
-                parity=parity_map.get(parity, serial.PARITY_NONE),
+                stopbits=_STOPBITS_MAP.get(stopbits, serial.STOPBITS_ONE),
+                parity=_PARITY_MAP.get(parity, serial.PARITY_NONE),
                 timeout=0.1,
-                rtscts=(flow_control == "RTS/CTS"),
-                xonxoff=(flow_control == "XON/XOFF"),
+                rtscts=rtscts,
+                xonxoff=xonxoff,
             )
             self.is_connected = True
             self._tx_bytes = 0
@@ -121,84 +243,162 @@ class SerialHandler:
         self.is_connected = False
         return True, "Disconnected"
 
-    def send(self, data):
+    def send(self, data, *, encode=True):
         """
         Sends data through the serial port.
-        
+
         Args:
-            data: str or bytes - data to send. Strings are encoded to latin-1.
-        
+            data: str, bytes or bytearray - data to send
+            encode: bool - encode str data to latin-1; False sends data as is
+
         Returns: bool - True if sent successfully
         """
         if not self.is_connected or not self._serial:
             return False
         try:
-            if isinstance(data, str):
-                data = data.encode("latin-1", errors="replace")
+            if encode and isinstance(data, str):
+                # ASCII (the usual case) skips the error-handler setup
+                data = (data.encode("ascii") if data.isascii()
+                        else data.encode("latin-1", errors="replace"))
             self._serial.write(data)
             self._tx_bytes += len(data)
+            self._notify_stats()
             return True
         except Exception:
             self.is_connected = False
-            self.rx_queue.put(("__DISCONNECTED__", None))
+            self._enqueue(("__DISCONNECTED__", None))
             return False
 
     def send_bytes(self, data):
         """
         Sends raw bytes through the serial port (for control characters).
+        Same as send(data, encode=False).
 
         Args:
             data: bytes - raw bytes to send
 
         Returns: bool - True if sent successfully
         """
-        if not self.is_connected or not self._serial:
-            return False
-        try:
-            self._serial.write(data)
-            self._tx_bytes += len(data)
-            return True
-        except Exception:
-            self.is_connected = False
-            self.rx_queue.put(("__DISCONNECTED__", None))
-            return False
+        return self.send(data, encode=False)
 
-    def send_break(self, duration=0.25):
+    def send_break(self, duration=0.25, blocking=False):
         """
         Sends a serial BREAK signal.
 
+        By default this does not block: the break condition is raised now and
+        cleared by a Tk timer after `duration`, so calling it from the GUI
+        thread does not freeze the UI for the break length. Worker threads
+        that must wait for the break to end (e.g. command sequences) pass
+        blocking=True; without a Tk root the call always blocks.
+
         Args:
             duration: float - break duration in seconds (default 0.25)
+            blocking: bool - hold the calling thread for the whole break
 
         Returns: bool - True if sent successfully
         """
         if not self.is_connected or not self._serial:
             return False
         try:
-            self._serial.send_break(duration=duration)
+            if blocking or self._tk_root is None:
+                self._serial.send_break(duration=duration)
+                return True
+            ser = self._serial
+            ser.break_condition = True
+            self._tk_root.after(int(duration * 1000), self._end_break, ser)
             return True
         except Exception:
             self.is_connected = False
-            self.rx_queue.put(("__DISCONNECTED__", None))
+            self._enqueue(("__DISCONNECTED__", None))
             return False
 
+    @staticmethod
+    def _end_break(ser):
+        """
+        Clears a break condition raised by send_break (Tk timer callback).
+
+        Args:
+            ser: serial.Serial - port the break was raised on
+        """
+        try:
+            ser.break_condition = False
+        except Exception:
+            pass   # port closed meanwhile
+
     def _reader_loop(self):
         """
         Background thread loop: reads bytes from serial port and enqueues them.
-        Puts tuples of ("data", bytes) or ("__DISCONNECTED__", None) into rx_queue.
+        Puts tuples of ("data_str", str) or ("__DISCONNECTED__", None) into rx_queue.
+        Data is decoded here as latin-1 (1:1 with bytes, cannot fail) so the
+        GUI thread does not pay for it; text.encode("latin-1") restores the bytes.
+        Each read blocks for the first byte (up to the port timeout, so
+        _running is still checked); whatever arrives in the next
+        RX_BATCH_WINDOW seconds is collected into the same chunk.
         """
         while self._running and self._serial and self._serial.is_open:
             try:
-                data = self._serial.read(256)
+                ser = self._serial
+                data = ser.read(ser.in_waiting or 1)
                 if data:
+                    data = self._read_batch(ser, data)
+                    if not self._running:
+                        break   # disconnect() is joining; don't call into the GUI
                     self._rx_bytes += len(data)
-                    self.rx_queue.put(("data", data))
+                    sink = self._data_sink
+                    if sink is not None:
+                        self._call_rx_callback(sink, data)
+                    else:
+                        text = data.decode("latin-1")
+                        self._enqueue(("data_str", text))
+                        listener = self._rx_listener
+                        if listener is not None:
+                            self._call_rx_callback(listener, text)
+                    self._notify_stats()
             except Exception:
                 if self._running:
                     self.is_connected = False
-                    self.rx_queue.put(("__DISCONNECTED__", None))
+                    self._enqueue(("__DISCONNECTED__", None))
+                break
+
+    @staticmethod
+    def _call_rx_callback(fn, arg):
+        """
+        Runs the data sink or RX listener on the reader thread. A failure in
+        the callback is logged and does not count as a port error, so it
+        neither disconnects nor stops the reader.
+
+        Args:
+            fn: callable - the sink or listener
+            arg: bytes or str - the received data
+        """
+        try:
+            fn(arg)
+        except Exception:
+            logger.exception("RX callback %r failed", fn)
+
+    def _read_batch(self, ser, first):
+        """
+        Extends a just-read chunk with data arriving within RX_BATCH_WINDOW.
+
+        Args:
+            ser: serial.Serial - the open port
+            first: bytes - data returned by the blocking read
+
+        Returns: bytes - whatever arrived before the window closed; reading
+                 stops early once RX_BATCH_BYTES or more are buffered
+        """
+        buf = bytearray(first)
+        deadline = time.perf_counter() + self.RX_BATCH_WINDOW
+        while len(buf) < self.RX_BATCH_BYTES:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
                 break
-            time.sleep(0.01)
+            n = ser.in_waiting
+            if n:
+                buf += ser.read(n)
+            else:
+                time.sleep(min(remaining, 0.001))
+        return bytes(buf)
 
     def get_stats(self):
         """